@@ -0,0 +1,66 @@
+# tests/api/test_api_async.py
+import asyncio
+import os
+
+import pytest
+import pytest_asyncio
+
+from tests.common.async_client import AsyncVaultwardenClient
+from tests.common.envtools import resolve_api_credentials
+
+VAULTWARDEN_URL, CLIENT_ID, CLIENT_SECRET = resolve_api_credentials()
+
+# how many identical requests each concurrent endpoint check fires
+FANOUT = int(os.getenv("VW_ASYNC_FANOUT", "10"))
+
+
+@pytest_asyncio.fixture
+async def aclient():
+    async with AsyncVaultwardenClient(
+        VAULTWARDEN_URL, CLIENT_ID, CLIENT_SECRET, max_connections=FANOUT
+    ) as client:
+        yield client
+
+
+@pytest_asyncio.fixture
+async def authed_client(aclient):
+    if not CLIENT_ID or not CLIENT_SECRET:
+        pytest.skip("CLIENT_ID/CLIENT_SECRET missing in env")
+    # fetch the token once up front so the fan-out doesn't race on it
+    await aclient.auth_header()
+    return aclient
+
+
+############ CONCURRENT API CHECKS ############
+
+
+# Health probes in one event loop
+@pytest.mark.asyncio
+async def test_health_probes_concurrently(aclient):
+    paths = ["/alive", "/api/alive", "/api/version"]
+    responses = await aclient.gather_get(paths, timeout=5)
+    for path, r in zip(paths, responses):
+        assert r.status_code == 200, f"{path} returned {r.status_code}"
+
+
+# Account Profile under concurrency
+@pytest.mark.asyncio
+async def test_account_profile_concurrent(authed_client):
+    results = await asyncio.gather(
+        *(authed_client.api_json("/accounts/profile") for _ in range(FANOUT))
+    )
+    ids = set()
+    for data in results:
+        assert isinstance(data, dict), f"Expected JSON object, got {type(data).__name__}"
+        assert "email" in data, "Profile response missing 'email'"
+        ids.add(data.get("id"))
+    assert len(ids) == 1, f"Concurrent profile reads disagreed on user id: {ids}"
+
+
+# List Ciphers under concurrency
+@pytest.mark.asyncio
+async def test_list_ciphers_concurrent(authed_client):
+    results = await asyncio.gather(*(authed_client.api_json("/ciphers") for _ in range(FANOUT)))
+    for data in results:
+        assert isinstance(data, dict), "Expected JSON object from /ciphers"
+        assert isinstance(data.get("data"), list), "'data' missing or not a list"
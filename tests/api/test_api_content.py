@@ -0,0 +1,91 @@
+# tests/api/test_api_content.py
+import os
+import uuid
+
+import pytest
+import requests
+
+from tests.common.client import get_client
+from tests.common.envtools import resolve_api_credentials
+from tests.common.vault_crypto import VaultCryptoError, VaultKeys
+
+VAULTWARDEN_URL, CLIENT_ID, CLIENT_SECRET = resolve_api_credentials()
+EMAIL, PASSWORD = os.getenv("VW_EMAIL"), os.getenv("VW_PASSWORD")
+
+
+@pytest.fixture(scope="module")
+def client():
+    if not CLIENT_ID or not CLIENT_SECRET:
+        pytest.skip("CLIENT_ID/CLIENT_SECRET missing in env")
+    return get_client(VAULTWARDEN_URL, CLIENT_ID, CLIENT_SECRET)
+
+
+@pytest.fixture(scope="module")
+def keys(client):
+    if not EMAIL or not PASSWORD:
+        pytest.skip("VW_EMAIL/VW_PASSWORD missing in env")
+    vault_keys = VaultKeys(client, EMAIL, PASSWORD)
+    try:
+        vault_keys.user_key
+    except (VaultCryptoError, requests.RequestException, KeyError, TypeError) as e:
+        pytest.skip(f"user key not derivable for {EMAIL}: {e}")
+    return vault_keys
+
+
+@pytest.fixture
+def login_item(client, keys):
+    enc = keys.encrypt
+    plain = {
+        "name": f"content-{uuid.uuid4().hex[:8]}",
+        "username": "content-user",
+        "password": uuid.uuid4().hex,
+        "uri": "https://content.example.com",
+        "notes": "decrypted notes",
+    }
+    body = {
+        "type": 1,
+        "name": enc(plain["name"]),
+        "notes": enc(plain["notes"]),
+        "favorite": False,
+        "folderId": None,
+        "organizationId": None,
+        "reprompt": 0,
+        "fields": [{"type": 0, "name": enc("env"), "value": enc("staging")}],
+        "login": {
+            "username": enc(plain["username"]),
+            "password": enc(plain["password"]),
+            "totp": None,
+            "uris": [{"uri": enc(plain["uri"]), "match": None}],
+        },
+    }
+    r = client.post("/api/ciphers", auth=True, json=body)
+    r.raise_for_status()
+    cipher_id = r.json()["id"]
+    yield cipher_id, plain
+    client.delete(f"/api/ciphers/{cipher_id}", auth=True)
+
+
+############ CONTENT-LEVEL CHECKS ############
+
+
+# Created item decrypts back to what was stored
+def test_cipher_round_trip(client, keys, login_item):
+    cipher_id, plain = login_item
+    item = keys.decrypt_ciphers([client.api_json(f"/ciphers/{cipher_id}")])[0][0]
+    assert item["name"] == plain["name"]
+    assert item["notes"] == plain["notes"]
+    assert item["login"]["username"] == plain["username"]
+    assert item["login"]["password"] == plain["password"]
+    assert item["login"]["uris"] == [plain["uri"]]
+    assert item["fields"] == {"env": "staging"}
+
+
+# Whole vault decrypts with the user key (cost is guarded in tests/perf)
+def test_vault_listing_decrypts(client, keys, login_item):
+    cipher_id, plain = login_item
+    decrypted, skipped = keys.decrypt_ciphers(client.iter_api_items("/ciphers", "data"))
+
+    by_id = {c["id"]: c for c in decrypted}
+    assert by_id.get(cipher_id, {}).get("name") == plain["name"], "Created item not in listing"
+    personal = [s for s in skipped if "organization" not in s[1]]
+    assert not personal, f"Personal items failed to decrypt: {personal[:5]}"
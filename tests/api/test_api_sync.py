@@ -0,0 +1,92 @@
+# tests/api/test_api_sync.py
+import os
+
+import pytest
+import requests
+
+from tests.common.ciphers import build_cipher
+from tests.common.client import get_client
+from tests.common.envtools import resolve_api_credentials
+from tests.common.sync import SyncClient
+from tests.common.vault_crypto import VaultCryptoError, VaultKeys
+
+VAULTWARDEN_URL, CLIENT_ID, CLIENT_SECRET = resolve_api_credentials()
+EMAIL, PASSWORD = os.getenv("VW_EMAIL"), os.getenv("VW_PASSWORD")
+
+
+@pytest.fixture(scope="module")
+def client():
+    if not CLIENT_ID or not CLIENT_SECRET:
+        pytest.skip("CLIENT_ID/CLIENT_SECRET missing in env")
+    return get_client(VAULTWARDEN_URL, CLIENT_ID, CLIENT_SECRET)
+
+
+@pytest.fixture
+def syncer(client, tmp_path):
+    return SyncClient(client, cache_dir=str(tmp_path))
+
+
+@pytest.fixture
+def create_note(client):
+    """
+    Create real-ciphertext notes under the account's user key (so the decrypt
+    checks in test_api_content.py still pass if one survives) and delete
+    every created note on teardown.
+    """
+    if not EMAIL or not PASSWORD:
+        pytest.skip("VW_EMAIL/VW_PASSWORD missing in env")
+    keys = VaultKeys(client, EMAIL, PASSWORD)
+    try:
+        keys.user_key
+    except (VaultCryptoError, requests.RequestException, KeyError, TypeError) as e:
+        pytest.skip(f"user key not derivable for {EMAIL}: {e}")
+    created = []
+
+    def create():
+        r = client.post(
+            "/api/ciphers", auth=True, json=build_cipher("note", len(created), "sync", keys.encrypt)
+        )
+        r.raise_for_status()
+        created.append(r.json()["id"])
+        return created[-1]
+
+    yield create
+    for cipher_id in created:
+        client.delete(f"/api/ciphers/{cipher_id}", auth=True)
+
+
+############ SYNC ############
+
+
+# Full sync carries the profile and every cipher /api/ciphers lists
+def test_sync_payload(client, syncer):
+    result = syncer.sync(force=True)
+    assert not result.from_cache
+    assert isinstance(result.payload.get("profile"), dict), "Sync missing 'profile'"
+    assert isinstance(result.payload.get("folders"), list), "Sync missing 'folders'"
+    listed = {c["id"] for c in client.iter_api_items("/ciphers", "data")}
+    assert {c["id"] for c in result.ciphers} == listed
+    assert result.size_bytes > 0
+
+
+# Unchanged revision date: no re-download, in this run or the next one
+def test_sync_cached_while_revision_unchanged(client, syncer, tmp_path):
+    first = syncer.sync()
+    second = syncer.sync()
+    assert second.from_cache, "Second sync re-downloaded an unchanged vault"
+    assert second.revision == first.revision
+    assert second.payload == first.payload
+
+    next_run = SyncClient(client, cache_dir=str(tmp_path)).sync()
+    assert next_run.from_cache, "On-disk sync cache was not reused"
+    assert next_run.size_bytes == first.size_bytes
+
+
+# A vault change bumps the revision date and the next sync fetches it
+def test_sync_refetches_after_change(syncer, create_note):
+    before = syncer.sync()
+    cipher_id = create_note()
+    after = syncer.sync()
+    assert not after.from_cache, "Sync served a cached vault after a change"
+    assert after.revision != before.revision
+    assert cipher_id in {c["id"] for c in after.ciphers}
@@ -0,0 +1,102 @@
+# tests/common/async_client.py
+import asyncio
+
+import httpx
+
+from tests.common.auth import get_token_provider
+from tests.common.client import RETRY_STATUSES, _env_num
+
+
+class AsyncVaultwardenClient:
+    """
+    asyncio counterpart of VaultwardenClient for fan-out checks.
+
+    One httpx.AsyncClient (shared keep-alive pool) per instance; use it as an
+    async context manager. Bearer tokens come from the same TokenProvider as
+    the sync client, so both share one cached token.
+    """
+
+    def __init__(
+        self,
+        base_url,
+        client_id=None,
+        client_secret=None,
+        max_connections=None,
+        retries=None,
+        backoff=None,
+        timeout=None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.max_connections = max_connections or _env_num("VW_HTTP_POOL_SIZE", 10)
+        self.retries = retries if retries is not None else _env_num("VW_HTTP_RETRIES", 3)
+        self.backoff = backoff if backoff is not None else _env_num("VW_HTTP_BACKOFF", 0.5, float)
+        self.timeout = timeout if timeout is not None else _env_num("VW_HTTP_TIMEOUT", 10, float)
+        self._client = None
+
+    async def __aenter__(self):
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+            headers={"ngrok-skip-browser-warning": "true"},
+            transport=httpx.AsyncHTTPTransport(retries=self.retries),
+        )
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @property
+    def tokens(self):
+        return get_token_provider(self.base_url, self.client_id, self.client_secret)
+
+    async def auth_header(self) -> dict:
+        # token() may block on a refresh/file lock; keep the loop free
+        return await asyncio.to_thread(self.tokens.auth_header)
+
+    async def request(self, method, path, auth=False, **kwargs) -> httpx.Response:
+        if self._client is None:
+            raise RuntimeError("Use 'async with AsyncVaultwardenClient(...)' before requests.")
+        headers = dict(kwargs.pop("headers", None) or {})
+        if auth:
+            headers.update(await self.auth_header())
+
+        attempt = 0
+        while True:
+            r = await self._client.request(method, path, headers=headers, **kwargs)
+            if auth and r.status_code == 401 and attempt == 0:
+                await asyncio.to_thread(self.tokens.invalidate)
+                headers.update(await self.auth_header())
+            elif r.status_code in RETRY_STATUSES and method != "POST" and attempt < self.retries:
+                retry_after = r.headers.get("Retry-After", "")
+                delay = float(retry_after) if retry_after.isdigit() else self.backoff * 2**attempt
+                await asyncio.sleep(delay)
+            else:
+                return r
+            attempt += 1
+
+    async def get(self, path, **kwargs):
+        return await self.request("GET", path, **kwargs)
+
+    async def post(self, path, **kwargs):
+        return await self.request("POST", path, **kwargs)
+
+    async def api_json(self, endpoint: str):
+        """GET /api<endpoint> with auth, raise on HTTP errors, return parsed JSON."""
+        r = await self.get(f"/api{endpoint}", auth=True)
+        r.raise_for_status()
+        return r.json()
+
+    async def gather_get(self, paths, **kwargs) -> list:
+        """Issue GETs for all paths concurrently; results keep the input order."""
+        return await asyncio.gather(*(self.get(p, **kwargs) for p in paths))
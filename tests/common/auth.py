@@ -0,0 +1,179 @@
+# tests/common/auth.py
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+import requests
+
+try:  # POSIX only; on other platforms we fall back to in-process locking
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+from tests.common.envtools import env_flag
+
+
+class TokenProvider:
+    """
+    Shared client_credentials token source for one (url, client_id) pair.
+
+    - Caches the bearer token in memory and (optionally) on disk so parallel
+      workers/processes reuse one token instead of each hitting /identity.
+    - Reads `expires_in` from the token response and refreshes proactively
+      `refresh_margin` seconds before expiry.
+    - Keeps one stable deviceIdentifier per pair so refreshes don't register
+      a new device on the server every time.
+    """
+
+    def __init__(
+        self, url, client_id, client_secret, refresh_margin=60, cache_dir=None, session=None
+    ):
+        self.url = url.rstrip("/")
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.refresh_margin = refresh_margin
+        self.session = session
+        self._lock = threading.Lock()
+        self._token = None
+        self._expires_at = 0.0
+        self._lifetime = None
+        self._device_id = None
+
+        if cache_dir is None and env_flag("VW_TOKEN_CACHE", "1"):
+            cache_dir = os.getenv("VW_TOKEN_CACHE_DIR") or tempfile.gettempdir()
+        self._cache_path = None
+        if cache_dir:
+            key = hashlib.sha256(f"{self.url}|{client_id}".encode()).hexdigest()[:16]
+            self._cache_path = os.path.join(cache_dir, f"vw_token_{key}.json")
+
+    # ---------------- public API ----------------
+    def token(self) -> str:
+        """Return a valid bearer token, refreshing it if it is about to expire."""
+        with self._lock:
+            if self._is_fresh():
+                return self._token
+            with self._file_lock():
+                # another process may have refreshed while we waited for the lock
+                self._load()
+                if not self._is_fresh():
+                    self._refresh()
+                    self._save()
+            return self._token
+
+    def invalidate(self):
+        """Drop the cached token (e.g. after a 401) so the next call refreshes."""
+        with self._lock:
+            stale = self._token
+            with self._file_lock():
+                self._load()
+                # only clear the shared copy if nobody has refreshed it meanwhile
+                if self._token == stale:
+                    self._token = None
+                    self._expires_at = 0.0
+                    self._save()
+
+    def auth_header(self) -> dict:
+        return {"Authorization": f"Bearer {self.token()}"}
+
+    # ---------------- internals ----------------
+    def _is_fresh(self) -> bool:
+        return bool(self._token) and time.time() < self._expires_at - self._margin()
+
+    def _margin(self) -> float:
+        # never spend more than half the token lifetime in the refresh window
+        lifetime = self._lifetime or self.refresh_margin * 2
+        return min(self.refresh_margin, lifetime / 2)
+
+    def _refresh(self):
+        if not self.client_id or not self.client_secret:
+            raise RuntimeError("Set CLIENT_ID and CLIENT_SECRET for API key auth.")
+        if not self._device_id:
+            self._device_id = str(uuid.uuid4())
+        data = {
+            "grant_type": "client_credentials",
+            "scope": "api",
+            "client_id": self.client_id,
+            "client_secret": self.client_secret,
+            "deviceIdentifier": self._device_id,
+            "deviceType": "7",
+            "deviceName": "pytest",
+        }
+        post = self.session.post if self.session is not None else requests.post
+        r = post(
+            f"{self.url}/identity/connect/token",
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            data=data,
+            timeout=10,
+        )
+        if r.status_code >= 400:
+            raise RuntimeError(f"Token error {r.status_code}: {r.text}")
+        body = r.json()
+        self._token = body["access_token"]
+        self._lifetime = float(body.get("expires_in") or 3600)
+        self._expires_at = time.time() + self._lifetime
+
+    @contextmanager
+    def _file_lock(self):
+        if not self._cache_path or fcntl is None:
+            yield
+            return
+        with open(f"{self._cache_path}.lock", "a") as lf:
+            fcntl.flock(lf, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lf, fcntl.LOCK_UN)
+
+    def _load(self):
+        if not self._cache_path:
+            return
+        try:
+            with open(self._cache_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        self._device_id = self._device_id or data.get("device_id")
+        if data.get("expires_at", 0) > self._expires_at:
+            self._token = data.get("access_token")
+            self._expires_at = float(data["expires_at"])
+            self._lifetime = float(data.get("lifetime") or 3600)
+
+    def _save(self):
+        if not self._cache_path:
+            return
+        data = {
+            "access_token": self._token,
+            "expires_at": self._expires_at,
+            "lifetime": self._lifetime,
+            "device_id": self._device_id,
+        }
+        tmp = f"{self._cache_path}.{os.getpid()}.tmp"
+        try:
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, self._cache_path)
+        except OSError:
+            pass
+
+
+_providers = {}
+_providers_lock = threading.Lock()
+
+
+def get_token_provider(url, client_id, client_secret, session=None) -> TokenProvider:
+    """Return the process-wide TokenProvider for (url, client_id)."""
+    key = (url.rstrip("/"), client_id)
+    with _providers_lock:
+        provider = _providers.get(key)
+        if provider is None or provider.client_secret != client_secret:
+            provider = TokenProvider(url, client_id, client_secret, session=session)
+            _providers[key] = provider
+        elif provider.session is None and session is not None:
+            provider.session = session
+        return provider
@@ -0,0 +1,58 @@
+# tests/common/ciphers.py
+import base64
+import os
+import uuid
+
+KINDS = ("login", "note", "card")
+
+
+def placeholder_encstring(_plaintext: str) -> str:
+    """
+    Syntactically valid type-2 EncString (AES-CBC-256 + HMAC) with random bytes.
+
+    The server stores ciphers opaquely, so this is enough for listing/sync
+    load; pass a real `encrypt` callable (e.g. VaultKeys.encrypt) when clients
+    must decrypt the items.
+    """
+
+    def b64(n):
+        return base64.b64encode(os.urandom(n)).decode()
+
+    return f"2.{b64(16)}|{b64(32)}|{b64(32)}"
+
+
+def build_cipher(kind: str, index: int, run_id: str, encrypt, folder_id=None) -> dict:
+    """`POST /api/ciphers` body for one login/note/card; `encrypt` maps plaintext to an EncString."""
+    name = f"seed-{run_id}-{index:06d}"
+    base = {
+        "name": encrypt(name),
+        "notes": None,
+        "favorite": False,
+        "folderId": folder_id,
+        "organizationId": None,
+        "reprompt": 0,
+    }
+    if kind == "login":
+        base["type"] = 1
+        base["login"] = {
+            "username": encrypt(f"user{index}"),
+            "password": encrypt(uuid.uuid4().hex),
+            "uris": [{"uri": encrypt(f"https://seed{index}.example.com"), "match": None}],
+        }
+    elif kind == "note":
+        base["type"] = 2
+        base["notes"] = encrypt(f"seeded note {index}")
+        base["secureNote"] = {"type": 0}
+    elif kind == "card":
+        base["type"] = 3
+        base["card"] = {
+            "cardholderName": encrypt(f"Seed Holder {index}"),
+            "brand": encrypt("Visa"),
+            "number": encrypt("4111111111111111"),
+            "expMonth": encrypt("12"),
+            "expYear": encrypt("2030"),
+            "code": encrypt("123"),
+        }
+    else:
+        raise ValueError(f"Unknown cipher kind {kind!r}; choose from {KINDS}")
+    return base
@@ -0,0 +1,154 @@
+# tests/common/client.py
+import os
+import threading
+
+import ijson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from tests.common.auth import get_token_provider
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def _env_num(name, default, cast=int):
+    try:
+        return cast(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def build_session(pool_size=None, retries=None, backoff=None) -> requests.Session:
+    """
+    Keep-alive session with a bounded connection pool and retry/backoff on
+    429/5xx (honouring Retry-After). POST is never retried to avoid duplicates.
+    """
+    pool_size = pool_size if pool_size is not None else _env_num("VW_HTTP_POOL_SIZE", 10)
+    retries = retries if retries is not None else _env_num("VW_HTTP_RETRIES", 3)
+    backoff = backoff if backoff is not None else _env_num("VW_HTTP_BACKOFF", 0.5, float)
+
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=backoff,
+        status_forcelist=RETRY_STATUSES,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+    s = requests.Session()
+    s.mount("http://", adapter)
+    s.mount("https://", adapter)
+    # same trick the CI curl probes use; harmless off-ngrok
+    s.headers["ngrok-skip-browser-warning"] = "true"
+    return s
+
+
+class VaultwardenClient:
+    """
+    Thin wrapper over one pooled requests.Session for a Vaultwarden instance.
+
+    Paths are relative to the base URL (e.g. "/alive", "/api/ciphers").
+    Every call gets a default timeout; `auth=True` adds the cached bearer token
+    and refreshes it once on 401.
+    """
+
+    def __init__(
+        self,
+        base_url,
+        client_id=None,
+        client_secret=None,
+        pool_size=None,
+        retries=None,
+        backoff=None,
+        timeout=None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.timeout = timeout if timeout is not None else _env_num("VW_HTTP_TIMEOUT", 10, float)
+        self.session = build_session(pool_size, retries, backoff)
+
+    @property
+    def tokens(self):
+        return get_token_provider(
+            self.base_url, self.client_id, self.client_secret, session=self.session
+        )
+
+    def url(self, path: str) -> str:
+        return f"{self.base_url}{path}"
+
+    def request(self, method, path, auth=False, **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        headers = dict(kwargs.pop("headers", None) or {})
+        if auth:
+            headers.update(self.tokens.auth_header())
+        r = self.session.request(method, self.url(path), headers=headers, **kwargs)
+        if auth and r.status_code == 401:
+            # cached token was revoked/rotated server-side; refresh once and retry
+            r.close()
+            self.tokens.invalidate()
+            headers.update(self.tokens.auth_header())
+            r = self.session.request(method, self.url(path), headers=headers, **kwargs)
+        return r
+
+    def get(self, path, **kwargs):
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path, **kwargs):
+        return self.request("POST", path, **kwargs)
+
+    def put(self, path, **kwargs):
+        return self.request("PUT", path, **kwargs)
+
+    def delete(self, path, **kwargs):
+        return self.request("DELETE", path, **kwargs)
+
+    def api_json(self, endpoint: str):
+        """GET /api<endpoint> with auth, raise on HTTP errors, return parsed JSON."""
+        r = self.get(f"/api{endpoint}", auth=True)
+        r.raise_for_status()
+        return r.json()
+
+    def iter_api_items(self, endpoint: str, array: str = "data"):
+        """
+        Stream GET /api<endpoint> and lazily yield each element of the top-level
+        `array` (e.g. cipher dicts under "data") without materializing the body.
+        Raises ValueError if `array` is missing or not a list.
+        """
+        with self.get(f"/api{endpoint}", auth=True, stream=True) as r:
+            r.raise_for_status()
+            r.raw.decode_content = True  # let urllib3 undo gzip/deflate
+            seen = []
+
+            def events():
+                for prefix, event, value in ijson.parse(r.raw, use_float=True):
+                    if prefix == array and event == "start_array":
+                        seen.append(True)
+                    yield prefix, event, value
+
+            yield from ijson.items(events(), f"{array}.item")
+            if not seen:
+                raise ValueError(f"'{array}' list missing from /api{endpoint} response")
+
+    def close(self):
+        self.session.close()
+
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(base_url, client_id=None, client_secret=None) -> VaultwardenClient:
+    """Return the process-wide pooled client for (base_url, client_id)."""
+    key = (base_url.rstrip("/"), client_id, client_secret)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = VaultwardenClient(base_url, client_id, client_secret)
+            _clients[key] = client
+        return client
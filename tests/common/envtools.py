@@ -1,15 +1,90 @@
 # tests/common/envtools.py
+import json
 import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse
 
-import requests
 from dotenv import find_dotenv, load_dotenv
 
 # Load .env once for all tests
 load_dotenv(find_dotenv(), override=False)
 
 
+def env_flag(name: str, default: str = "") -> bool:
+    """True when env var `name` (or `default` if unset) is 1/true/yes, case-insensitive."""
+    return os.getenv(name, default).lower() in ("1", "true", "yes")
+
+
+_URL_CACHE_TTL = float(os.getenv("VW_URL_CACHE_TTL", "600"))  # seconds; 0 disables disk cache
+_resolved_url = None
+_resolved_lock = threading.Lock()
+
+
+def _url_cache_path() -> str:
+    return os.getenv("VW_URL_CACHE") or os.path.join(tempfile.gettempdir(), "vw_url_cache.json")
+
+
+def _read_url_cache(candidates):
+    if _URL_CACHE_TTL <= 0:
+        return None
+    try:
+        with open(_url_cache_path(), encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    # only valid for the same candidate list and within TTL
+    if data.get("candidates") != candidates or time.time() - data.get("at", 0) > _URL_CACHE_TTL:
+        return None
+    return data.get("url")
+
+
+def _write_url_cache(candidates, url):
+    if _URL_CACHE_TTL <= 0:
+        return
+    path = _url_cache_path()
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"candidates": candidates, "url": url, "at": time.time()}, f)
+        os.replace(tmp, path)  # concurrent workers never read a half-written file
+    except OSError:
+        pass
+
+
+def _alive(url, timeout=0.7) -> bool:
+    """One GET {url}/alive; True on 200."""
+    # imported here: client -> auth -> envtools would otherwise be circular
+    from tests.common.client import build_session
+
+    # no retries: a dead candidate should fail fast, not back off
+    with build_session(pool_size=1, retries=0) as probe:
+        return probe.get(f"{url}/alive", timeout=timeout).status_code == 200
+
+
+def _probe_first_alive(candidates, timeout=0.7):
+    """Probe all candidates concurrently; return the first one answering /alive with 200."""
+    pool = ThreadPoolExecutor(max_workers=len(candidates))
+    try:
+        futures = {pool.submit(_alive, u, timeout): u for u in candidates}
+        for fut in as_completed(futures):
+            try:
+                if fut.result():
+                    return futures[fut]
+            except Exception:
+                pass
+    finally:
+        # don't wait for slower dead candidates to time out
+        pool.shutdown(wait=False, cancel_futures=True)
+    return None
+
+
 def pick_url() -> str:
-    """Resolve VAULTWARDEN_URL from env/.env, or probe common ports."""
+    """Resolve VAULTWARDEN_URL from env/.env, or probe common ports (once per session)."""
+    global _resolved_url
+
     # 1) Most explicit wins
     url = os.getenv("VAULTWARDEN_URL")
     if url:
@@ -26,31 +101,45 @@ def pick_url() -> str:
         if url:
             return url
 
-    # 3) Probe candidates (alive)
-    candidates = [
-        os.getenv("LOCAL_VAULTWARDEN_URL"),
-        os.getenv("AWS_VAULTWARDEN_URL"),
-        "http://localhost:3000",
-        "http://localhost:8000",
-        "http://localhost:33000",
-    ]
-    for u in [c for c in candidates if c]:
-        try:
-            r = requests.get(f"{u}/alive", timeout=0.7)
-            if r.status_code == 200:
-                return u
-        except Exception:
-            pass
-
-    # Last resort
-    return "http://localhost:3000"
+    # 3) Probe candidates (alive): memoized per process, cached on disk across runs
+    with _resolved_lock:
+        if _resolved_url:
+            return _resolved_url
+
+        candidates = [
+            c
+            for c in [
+                os.getenv("LOCAL_VAULTWARDEN_URL"),
+                os.getenv("AWS_VAULTWARDEN_URL"),
+                "http://localhost:3000",
+                "http://localhost:8000",
+                "http://localhost:33000",
+            ]
+            if c
+        ]
+        url = _read_url_cache(candidates)
+        if url:
+            # one cheap check: the cached server may have stopped within the TTL
+            try:
+                url = url if _alive(url) else None
+            except Exception:
+                url = None
+        if not url:
+            url = _probe_first_alive(candidates)
+            if url:
+                _write_url_cache(candidates, url)
+
+        # Last resort (not memoized, so a server started later is still found)
+        if not url:
+            return "http://localhost:3000"
+        _resolved_url = url
+        return url
 
 
 def headless_default() -> bool:
     """Headless on CI/servers; visible on local desktops unless overridden."""
-    val = os.getenv("HEADLESS")
-    if val is not None:
-        return val.lower() in ("1", "true", "yes")
+    if os.getenv("HEADLESS") is not None:
+        return env_flag("HEADLESS")
 
     # Auto: if CI or no DISPLAY -> headless
     if os.getenv("GITHUB_ACTIONS") or os.getenv("CI") or not os.getenv("DISPLAY"):
@@ -58,24 +147,48 @@ def headless_default() -> bool:
     return False
 
 
-def resolve_api_credentials():
-    """Return (url, client_id, client_secret) using the same rules."""
+def worker_id() -> str:
+    """pytest-xdist worker name ('gw0', 'gw1', …), or 'main' when not running in parallel."""
+    return os.getenv("PYTEST_XDIST_WORKER", "main")
+
+
+def ui_credentials(email=None, password=None):
+    """
+    (email, password) for this worker's UI user. With VW_USERS set
+    ("a@x.com:pw1,b@x.com:pw2") each xdist worker gets its own entry
+    (round-robin by worker index); otherwise the given defaults are returned.
+    """
+    users = [u.strip() for u in os.getenv("VW_USERS", "").split(",") if ":" in u]
+    if not users:
+        return email, password
+    wid = worker_id()
+    index = int(wid[2:]) if wid.startswith("gw") and wid[2:].isdigit() else 0
+    user_email, user_password = users[index % len(users)].split(":", 1)
+    return user_email, user_password
+
+
+def resolve_api_credentials(strict: bool = False):
+    """
+    Return (url, client_id, client_secret) using the same rules as pick_url().
+    With strict=True, raise if no client credentials could be found.
+    """
     url = pick_url()
 
     # Explicit standard names take precedence
     cid = os.getenv("CLIENT_ID")
     csec = os.getenv("CLIENT_SECRET")
-    if cid and csec:
-        return url, cid, csec
-
-    prof = os.getenv("VW_PROFILE", "").lower()
-    if prof == "aws":
-        return url, os.getenv("AWS_CLIENT_ID"), os.getenv("AWS_CLIENT_SECRET")
-    if prof == "local":
-        return url, os.getenv("LOCAL_CLIENT_ID"), os.getenv("LOCAL_CLIENT_SECRET")
+    if not (cid and csec):
+        prof = os.getenv("VW_PROFILE", "").lower()
+        if prof not in ("aws", "local"):
+            # Fallback: infer from chosen url (8000/33000 are the AWS-tunnel ports)
+            port = urlparse(url).port
+            prof = "aws" if port in (8000, 33000) else "local"
+        prefix = prof.upper()
+        cid = os.getenv(f"{prefix}_CLIENT_ID")
+        csec = os.getenv(f"{prefix}_CLIENT_SECRET")
 
-    # Fallback: infer from chosen url
-    if "8000" in url or "33000" in url:
-        return url, os.getenv("AWS_CLIENT_ID"), os.getenv("AWS_CLIENT_SECRET")
-    else:
-        return url, os.getenv("LOCAL_CLIENT_ID"), os.getenv("LOCAL_CLIENT_SECRET")
+    if strict and not (cid and csec):
+        raise RuntimeError(
+            "No credentials found. Set CLIENT_ID/CLIENT_SECRET or VW_PROFILE and corresponding vars."
+        )
+    return url, cid, csec
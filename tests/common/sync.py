@@ -0,0 +1,104 @@
+# tests/common/sync.py
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+from tests.common.envtools import env_flag
+
+
+class SyncResult:
+    """One sync: the parsed payload plus what it cost to get it."""
+
+    def __init__(self, payload, revision, size_bytes, elapsed_ms, from_cache):
+        self.payload = payload
+        self.revision = revision  # accounts/revision-date the payload belongs to
+        self.size_bytes = size_bytes  # decoded body size of the download
+        self.elapsed_ms = elapsed_ms  # revision check (+ download when not cached)
+        self.from_cache = from_cache
+
+    @property
+    def ciphers(self) -> list:
+        return self.payload.get("ciphers") or self.payload.get("Ciphers") or []
+
+
+class SyncClient:
+    """
+    Full-vault `/api/sync` on top of a VaultwardenClient, cached the way real
+    clients do it: the response is stored with the account's revision date
+    (`/api/accounts/revision-date`, bumped on every vault change) and reused
+    while that date is unchanged, across runs via a temp-dir JSON file.
+    VW_SYNC_CACHE=0 keeps the cache in memory only; VW_SYNC_CACHE_DIR moves it.
+    """
+
+    def __init__(self, client, cache_dir=None, exclude_domains=True):
+        self.client = client
+        self.exclude_domains = exclude_domains
+        self._cached = None  # (revision, size_bytes, payload)
+        if cache_dir is None and env_flag("VW_SYNC_CACHE", "1"):
+            cache_dir = os.getenv("VW_SYNC_CACHE_DIR") or tempfile.gettempdir()
+        self._cache_path = None
+        if cache_dir:
+            key = hashlib.sha256(f"{client.base_url}|{client.client_id}".encode()).hexdigest()[:16]
+            self._cache_path = os.path.join(cache_dir, f"vw_sync_{key}.json")
+
+    def revision_date(self):
+        return self.client.api_json("/accounts/revision-date")
+
+    def sync(self, force=False) -> SyncResult:
+        """Current vault; downloaded only if the revision date moved (or `force`)."""
+        t0 = time.perf_counter()
+        revision = self.revision_date()
+        cached = self._cached or self._load()
+        if not force and cached and cached[0] == revision:
+            return SyncResult(cached[2], revision, cached[1], _ms_since(t0), True)
+
+        params = {"excludeDomains": "true"} if self.exclude_domains else None
+        r = self.client.get("/api/sync", auth=True, params=params)
+        r.raise_for_status()
+        payload = r.json()
+        elapsed = _ms_since(t0)
+        # keyed on the date read *before* the download: a change racing it
+        # only costs one extra download next time, never a stale hit
+        self._cached = (revision, len(r.content), payload)
+        self._save()
+        return SyncResult(payload, revision, len(r.content), elapsed, False)
+
+    def invalidate(self):
+        self._cached = None
+        if self._cache_path:
+            try:
+                os.remove(self._cache_path)
+            except OSError:
+                pass
+
+    # ---------------- internals ----------------
+    def _load(self):
+        if not self._cache_path:
+            return None
+        try:
+            with open(self._cache_path, encoding="utf-8") as f:
+                data = json.load(f)
+            self._cached = (data["revision"], data["size_bytes"], data["payload"])
+        except (OSError, ValueError, KeyError):
+            return None
+        return self._cached
+
+    def _save(self):
+        if not self._cache_path:
+            return
+        revision, size_bytes, payload = self._cached
+        tmp = f"{self._cache_path}.{os.getpid()}.tmp"
+        try:
+            # the payload carries the protected user/private keys: owner-only, like auth.py
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"revision": revision, "size_bytes": size_bytes, "payload": payload}, f)
+            os.replace(tmp, self._cache_path)
+        except OSError:
+            pass
+
+
+def _ms_since(t0) -> float:
+    return round((time.perf_counter() - t0) * 1000, 2)
@@ -0,0 +1,266 @@
+# tests/common/vault_crypto.py
+"""
+Client-side vault crypto (the subset of Bitwarden's scheme the tests need).
+
+    master key   = PBKDF2-SHA256(password, salt=email, iterations)
+                 | Argon2id(password, salt=SHA256(email), iterations, memory MiB, parallelism)
+    stretched    = HKDF-Expand(master key, "enc") || HKDF-Expand(master key, "mac")
+    user key     = decrypt(profile["key"], stretched)         # 64 bytes: enc || mac
+    item key     = decrypt(cipher["key"], user key)           # only when the cipher has one
+    EncString    = "2." + b64(iv) | b64(AES-256-CBC(data)) | b64(HMAC-SHA256(iv || ct))
+
+Items encrypted with the user key are readable by the web vault, so tests can
+create their preconditions through the API instead of the UI, and API tests
+can assert on decrypted content (decrypt_ciphers for whole /api/ciphers lists).
+"""
+
+import base64
+import binascii
+import functools
+import hashlib
+import hmac
+import os
+
+from argon2.low_level import Type, hash_secret_raw
+from cryptography.hazmat.primitives import padding
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+KDF_PBKDF2 = 0
+KDF_ARGON2ID = 1
+ENC_AES_CBC_256_HMAC_SHA256 = 2
+
+
+class VaultCryptoError(ValueError):
+    """Malformed EncString, failed MAC check or unsupported KDF/encryption type."""
+
+
+class SymmetricKey:
+    """AES-256 encryption key plus HMAC-SHA256 key (primitives built once per key)."""
+
+    def __init__(self, enc_key: bytes, mac_key: bytes):
+        if len(enc_key) != 32 or len(mac_key) != 32:
+            raise VaultCryptoError("symmetric keys must be 32 + 32 bytes")
+        self.enc_key = enc_key
+        self.mac_key = mac_key
+        self._aes = algorithms.AES(enc_key)
+        self._hmac = hmac.new(mac_key, digestmod=hashlib.sha256)  # copied per message
+
+    @classmethod
+    def from_bytes(cls, raw: bytes) -> "SymmetricKey":
+        if len(raw) != 64:
+            raise VaultCryptoError(f"expected a 64-byte key, got {len(raw)}")
+        return cls(raw[:32], raw[32:])
+
+    def mac(self, data: bytes) -> bytes:
+        h = self._hmac.copy()
+        h.update(data)
+        return h.digest()
+
+
+# ---------------- key derivation ----------------
+@functools.lru_cache(maxsize=32)
+def derive_master_key(
+    password: str, email: str, kdf: int, iterations: int, memory=None, parallelism=None
+) -> bytes:
+    """
+    Master key for the account's KDF settings (Argon2id memory in MiB).
+    Cached per process, so every test using the same account pays the KDF once.
+    """
+    email = email.strip().lower()
+    if kdf == KDF_PBKDF2:
+        return hashlib.pbkdf2_hmac("sha256", password.encode(), email.encode(), iterations, 32)
+    if kdf == KDF_ARGON2ID:
+        return hash_secret_raw(
+            secret=password.encode(),
+            salt=hashlib.sha256(email.encode()).digest(),
+            time_cost=iterations,
+            memory_cost=(memory or 64) * 1024,  # argon2-cffi takes KiB
+            parallelism=parallelism or 4,
+            hash_len=32,
+            type=Type.ID,
+        )
+    raise VaultCryptoError(f"unsupported KDF type {kdf}")
+
+
+def _hkdf_expand(prk: bytes, info: bytes) -> bytes:
+    # 32-byte output == one HMAC-SHA256 block: T(1) = HMAC(prk, info || 0x01)
+    return hmac.new(prk, info + b"\x01", hashlib.sha256).digest()
+
+
+def stretch_master_key(master_key: bytes) -> SymmetricKey:
+    return SymmetricKey(_hkdf_expand(master_key, b"enc"), _hkdf_expand(master_key, b"mac"))
+
+
+# ---------------- EncString ----------------
+def encrypt_bytes(key: SymmetricKey, data: bytes) -> str:
+    iv = os.urandom(16)
+    padder = padding.PKCS7(128).padder()
+    padded = padder.update(data) + padder.finalize()
+    enc = Cipher(key._aes, modes.CBC(iv)).encryptor()
+    ct = enc.update(padded) + enc.finalize()
+    mac = key.mac(iv + ct)
+    b64 = base64.b64encode
+    return (
+        f"{ENC_AES_CBC_256_HMAC_SHA256}.{b64(iv).decode()}|{b64(ct).decode()}|{b64(mac).decode()}"
+    )
+
+
+def encrypt_string(key: SymmetricKey, text: str) -> str:
+    return encrypt_bytes(key, text.encode("utf-8"))
+
+
+def decrypt_bytes(key: SymmetricKey, encstring: str) -> bytes:
+    try:
+        enc_type, payload = encstring.split(".", 1)
+        iv, ct, mac = (base64.b64decode(p) for p in payload.split("|"))
+    except (AttributeError, ValueError, binascii.Error) as e:
+        raise VaultCryptoError(f"malformed EncString: {encstring!r:.40}") from e
+    if enc_type != str(ENC_AES_CBC_256_HMAC_SHA256):
+        raise VaultCryptoError(f"unsupported EncString type {enc_type}")
+    if not hmac.compare_digest(mac, key.mac(iv + ct)):
+        raise VaultCryptoError("EncString MAC mismatch (wrong key?)")
+    dec = Cipher(key._aes, modes.CBC(iv)).decryptor()
+    padded = dec.update(ct) + dec.finalize()
+    unpadder = padding.PKCS7(128).unpadder()
+    try:
+        return unpadder.update(padded) + unpadder.finalize()
+    except ValueError as e:
+        raise VaultCryptoError("bad PKCS#7 padding") from e
+
+
+def decrypt_string(key: SymmetricKey, encstring):
+    """Plaintext of an EncString (None passes through)."""
+    return None if encstring is None else decrypt_bytes(key, encstring).decode("utf-8")
+
+
+def unwrap_user_key(stretched: SymmetricKey, protected_key: str) -> SymmetricKey:
+    """Decrypt the account's protected symmetric key (profile "key")."""
+    return SymmetricKey.from_bytes(decrypt_bytes(stretched, protected_key))
+
+
+def _field(d: dict, name: str):
+    # Vaultwarden answers camelCase; older builds used PascalCase
+    return d.get(name, d.get(name[:1].upper() + name[1:]))
+
+
+# ---------------- ciphers ----------------
+# EncString fields of the per-type sections (1 login, 2 secure note, 3 card, 4 identity)
+_CARD_FIELDS = ("cardholderName", "brand", "number", "expMonth", "expYear", "code")
+_IDENTITY_FIELDS = (
+    "title", "firstName", "middleName", "lastName", "address1", "address2", "address3",
+    "city", "state", "postalCode", "country", "company", "email", "phone", "ssn",
+    "username", "passportNumber", "licenseNumber",
+)  # fmt: skip
+
+
+def decrypt_cipher(key: SymmetricKey, cipher: dict) -> dict:
+    """
+    Plaintext view of one /api/ciphers item: id, type, name, notes, the type's
+    section and custom fields (name -> value). Uses the item's own key when it
+    has one. Organization items raise VaultCryptoError (they need the org key).
+    """
+    if _field(cipher, "organizationId"):
+        raise VaultCryptoError("organization ciphers need the organization key")
+    item_key = _field(cipher, "key")
+    if item_key:
+        key = SymmetricKey.from_bytes(decrypt_bytes(key, item_key))
+
+    def dec(value):
+        return decrypt_string(key, value)
+
+    out = {
+        "id": _field(cipher, "id"),
+        "type": _field(cipher, "type"),
+        "name": dec(_field(cipher, "name")),
+        "notes": dec(_field(cipher, "notes")),
+    }
+    login = _field(cipher, "login")
+    if login:
+        out["login"] = {
+            "username": dec(_field(login, "username")),
+            "password": dec(_field(login, "password")),
+            "totp": dec(_field(login, "totp")),
+            "uris": [dec(_field(u, "uri")) for u in _field(login, "uris") or []],
+        }
+    card = _field(cipher, "card")
+    if card:
+        out["card"] = {f: dec(_field(card, f)) for f in _CARD_FIELDS}
+    identity = _field(cipher, "identity")
+    if identity:
+        out["identity"] = {f: dec(_field(identity, f)) for f in _IDENTITY_FIELDS}
+    out["fields"] = {
+        dec(_field(f, "name")): dec(_field(f, "value")) for f in _field(cipher, "fields") or []
+    }
+    return out
+
+
+def decrypt_ciphers(key: SymmetricKey, ciphers) -> tuple:
+    """
+    Batch path for whole vault listings: every personal item is decrypted with
+    the same prebuilt AES/HMAC primitives. Returns (decrypted, skipped), where
+    skipped holds (id, reason) for organization items and undecryptable ones,
+    so one foreign item doesn't fail a content check over thousands.
+    """
+    decrypted, skipped = [], []
+    for cipher in ciphers:
+        try:
+            decrypted.append(decrypt_cipher(key, cipher))
+        except (VaultCryptoError, UnicodeDecodeError) as e:
+            skipped.append((_field(cipher, "id"), str(e)))
+    return decrypted, skipped
+
+
+# ---------------- account ----------------
+class VaultKeys:
+    """
+    User key for the account behind a VaultwardenClient's API key, derived from
+    its master password (prelogin KDF params + the protected key in the profile).
+    """
+
+    def __init__(self, client, email: str, password: str):
+        self.client = client
+        self.email = email
+        self.password = password
+        self._user_key = None
+
+    def kdf_params(self) -> dict:
+        r = self.client.post("/api/accounts/prelogin", json={"email": self.email})
+        if r.status_code == 404:  # newer servers moved it under /identity
+            r = self.client.post("/identity/accounts/prelogin", json={"email": self.email})
+        r.raise_for_status()
+        body = r.json()
+        return {
+            "kdf": _field(body, "kdf"),
+            "iterations": _field(body, "kdfIterations"),
+            "memory": _field(body, "kdfMemory"),
+            "parallelism": _field(body, "kdfParallelism"),
+        }
+
+    @property
+    def user_key(self) -> SymmetricKey:
+        if self._user_key is None:
+            profile = self.client.api_json("/accounts/profile")
+            owner = (_field(profile, "email") or "").lower()
+            if owner != self.email.lower():
+                raise VaultCryptoError(f"API key belongs to {owner!r}, not {self.email!r}")
+            params = self.kdf_params()
+            master = derive_master_key(
+                self.password,
+                self.email,
+                params["kdf"],
+                params["iterations"],
+                params["memory"],
+                params["parallelism"],
+            )
+            self._user_key = unwrap_user_key(stretch_master_key(master), _field(profile, "key"))
+        return self._user_key
+
+    def encrypt(self, text):
+        """EncString for `text` under the user key (None passes through)."""
+        return None if text is None else encrypt_string(self.user_key, text)
+
+    def decrypt(self, encstring):
+        return decrypt_string(self.user_key, encstring)
+
+    def decrypt_ciphers(self, ciphers) -> tuple:
+        return decrypt_ciphers(self.user_key, ciphers)
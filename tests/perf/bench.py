@@ -0,0 +1,186 @@
+# tests/perf/bench.py
+"""
+Load/throughput benchmark for Vaultwarden API endpoints.
+
+    python -m tests.perf.bench --concurrency 20 --duration 30 --ramp-up 5 \
+        --endpoints ciphers,profile,version --out reports/perf-api.json
+
+Prints (and optionally writes) a JSON report with requests/sec, p50/p95/p99
+latency and error rates, overall and per endpoint, over the steady-state
+window only (requests started after --ramp-up; rps per --duration second).
+Ramp-up traffic is summarized separately under "ramp_up". Keys are sorted so
+two runs can be diffed directly.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from datetime import UTC, datetime
+
+from tests.common.async_client import AsyncVaultwardenClient
+from tests.common.envtools import resolve_api_credentials
+
+# name -> (path, needs auth)
+ENDPOINTS = {
+    "ciphers": ("/api/ciphers", True),
+    "profile": ("/api/accounts/profile", True),
+    "version": ("/api/version", False),
+    "alive": ("/api/alive", False),
+}
+
+
+def percentile(sorted_vals, q: float) -> float:
+    """Linear-interpolated percentile (q in 0..100) of an already sorted list."""
+    if not sorted_vals:
+        return 0.0
+    k = (len(sorted_vals) - 1) * q / 100.0
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_vals) - 1)
+    return sorted_vals[lo] + (sorted_vals[hi] - sorted_vals[lo]) * (k - lo)
+
+
+def summarize(samples, elapsed: float) -> dict:
+    """samples: list of (latency_seconds, ok, ...) tuples for one endpoint (or all)."""
+    lat = sorted(s[0] * 1000.0 for s in samples)
+    errors = sum(1 for s in samples if not s[1])
+    n = len(samples)
+    return {
+        "requests": n,
+        "errors": errors,
+        "error_rate": round(errors / n, 4) if n else 0.0,
+        "rps": round(n / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": {
+            "min": round(lat[0], 2) if lat else 0.0,
+            "mean": round(sum(lat) / n, 2) if n else 0.0,
+            "p50": round(percentile(lat, 50), 2),
+            "p95": round(percentile(lat, 95), 2),
+            "p99": round(percentile(lat, 99), 2),
+            "max": round(lat[-1], 2) if lat else 0.0,
+        },
+    }
+
+
+async def _worker(client, index, endpoints, start, ramp_up, concurrency, deadline, samples):
+    # spread worker start times evenly across the ramp-up window
+    delay = start + ramp_up * index / max(concurrency, 1) - time.perf_counter()
+    if delay > 0:
+        await asyncio.sleep(delay)
+    i = index
+    while time.perf_counter() < deadline:
+        name = endpoints[i % len(endpoints)]
+        path, auth = ENDPOINTS[name]
+        t0 = time.perf_counter()
+        try:
+            r = await client.get(path, auth=auth)
+            ok = r.status_code < 400
+        except Exception:
+            ok = False
+        # third field: started in the steady-state window (after ramp-up)
+        samples[name].append((time.perf_counter() - t0, ok, t0 >= start + ramp_up))
+        i += 1
+
+
+async def run_benchmark(
+    url,
+    client_id=None,
+    client_secret=None,
+    endpoints=("ciphers", "profile", "version"),
+    concurrency=10,
+    duration=10.0,
+    ramp_up=0.0,
+) -> dict:
+    unknown = [e for e in endpoints if e not in ENDPOINTS]
+    if unknown:
+        raise ValueError(f"Unknown endpoints {unknown}; choose from {sorted(ENDPOINTS)}")
+
+    samples = {name: [] for name in endpoints}
+    started_at = datetime.now(UTC).isoformat(timespec="seconds")
+    # retries would hide server errors from the error rate
+    async with AsyncVaultwardenClient(
+        url, client_id, client_secret, max_connections=concurrency, retries=0
+    ) as client:
+        version = vault_items = None
+        if any(ENDPOINTS[e][1] for e in endpoints):
+            await client.auth_header()  # warm the token outside the timed window
+            try:
+                # results only compare across runs at the same vault size
+                vault_items = len((await client.api_json("/ciphers")).get("data") or [])
+            except Exception:
+                pass
+        try:
+            version = (await client.get("/api/version")).json()
+        except Exception:
+            pass
+
+        start = time.perf_counter()
+        deadline = start + ramp_up + duration
+        await asyncio.gather(
+            *(
+                _worker(client, i, list(endpoints), start, ramp_up, concurrency, deadline, samples)
+                for i in range(concurrency)
+            )
+        )
+        elapsed = time.perf_counter() - start
+
+    # latency/rps cover the steady-state window only, so runs with different
+    # --ramp-up compare directly; the partial-load period is reported apart
+    steady = {name: [s for s in per if s[2]] for name, per in samples.items()}
+    ramping = [s for per in samples.values() for s in per if not s[2]]
+    all_steady = [s for per in steady.values() for s in per]
+    return {
+        "meta": {
+            "url": url,
+            "server_version": version,
+            "vault_items": vault_items,
+            "started_at": started_at,
+            "concurrency": concurrency,
+            "duration_s": duration,
+            "ramp_up_s": ramp_up,
+            "elapsed_s": round(elapsed, 3),
+        },
+        "overall": summarize(all_steady, duration),
+        "endpoints": {name: summarize(per, duration) for name, per in steady.items()},
+        "ramp_up": summarize(ramping, ramp_up) if ramp_up else None,
+    }
+
+
+def write_report(report: dict, path: str):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(description="Vaultwarden API load benchmark")
+    p.add_argument("--endpoints", default="ciphers,profile,version")
+    p.add_argument("--concurrency", type=int, default=10)
+    p.add_argument("--duration", type=float, default=10.0, help="steady-state seconds")
+    p.add_argument("--ramp-up", type=float, default=0.0, help="seconds to start all workers")
+    p.add_argument("--out", help="write the JSON report here as well as stdout")
+    args = p.parse_args(argv)
+
+    url, cid, csec = resolve_api_credentials()
+    report = asyncio.run(
+        run_benchmark(
+            url.rstrip("/"),
+            cid,
+            csec,
+            endpoints=[e.strip() for e in args.endpoints.split(",") if e.strip()],
+            concurrency=args.concurrency,
+            duration=args.duration,
+            ramp_up=args.ramp_up,
+        )
+    )
+    if args.out:
+        write_report(report, args.out)
+    json.dump(report, sys.stdout, indent=2, sort_keys=True)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,60 @@
+# tests/perf/conftest.py
+import os
+from pathlib import Path
+
+import pytest
+
+from tests.common.envtools import env_flag, resolve_api_credentials
+from tests.perf.seed import VaultSeeder
+
+_PERF_DIR = Path(__file__).parent
+
+
+def pytest_collection_modifyitems(config, items):
+    """Mark everything under tests/perf as `perf`; skip it unless VW_PERF=1."""
+    skip = pytest.mark.skip(reason="perf suite is opt-in; set VW_PERF=1")
+    enabled = env_flag("VW_PERF")
+    for item in items:
+        if _PERF_DIR not in item.path.parents:
+            continue  # the hook sees the whole session's items
+        item.add_marker(pytest.mark.perf)
+        if not enabled:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def seed_vault():
+    """
+    `seed_vault(count)` grows the vault by `count` ciphers once per session and
+    size; later calls with the same count reuse that seed. Everything seeded
+    is bulk-deleted at session end.
+    """
+    url, cid, csec = resolve_api_credentials()
+    seeders, manifests = [], {}
+
+    def seed(count):
+        if count not in manifests:
+            if not cid or not csec:
+                pytest.skip("CLIENT_ID/CLIENT_SECRET missing in env")
+            seeder = VaultSeeder(url, cid, csec, workers=int(os.getenv("VW_SEED_WORKERS", "8")))
+            seeders.append(seeder)  # before seeding, so a partial seed is torn down too
+            manifests[count] = seeder.seed(count, manifest_path=os.getenv("VW_SEED_MANIFEST"))
+        return manifests[count]
+
+    try:
+        yield seed
+    finally:
+        # also after a failed/interrupted seed: the folder finds the rest
+        for seeder in seeders:
+            if seeder.manifest:
+                seeder.teardown(seeder.manifest)
+
+
+@pytest.fixture(scope="session")
+def seeded_vault(seed_vault):
+    """
+    The vault grown by VW_SEED_COUNT ciphers, shared by every perf module.
+    Returns the seeding manifest (None when VW_SEED_COUNT is unset/0).
+    """
+    count = int(os.getenv("VW_SEED_COUNT", "0"))
+    return seed_vault(count) if count > 0 else None
@@ -0,0 +1,223 @@
+# tests/perf/kdf_bench.py
+"""
+Key-derivation benchmark: what each KDF setting costs on this CPU.
+
+    python -m tests.perf.kdf_bench --budget-ms 500 --out reports/kdf-bench.json
+    python -m tests.perf.kdf_bench --pbkdf2 350000,600000,1000000 \
+        --argon2-memory 32,64,128 --argon2-iterations 2,3,4 --argon2-parallelism 1,4
+
+Every login derives the master key once (LoginPage.click_login waits on it in
+the web vault), so the account's KDF settings set a floor on login latency.
+For each configuration the report holds:
+
+    single  one derivation at a time: ms per derivation (min/p50/max)
+    multi   one derivation per core in parallel processes: ms and derivations/s,
+            i.e. how a shared runner or a login burst behaves
+
+and a recommendation per KDF: the strongest measured setting whose single p50
+fits the budget. Browsers derive slower than native code, so leave headroom.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import UTC, datetime
+
+from tests.common.vault_crypto import KDF_ARGON2ID, KDF_PBKDF2, derive_master_key
+from tests.perf.bench import write_report
+
+# Bitwarden's defaults and the lowest settings its clients accept
+PBKDF2_DEFAULT, PBKDF2_MIN = 600_000, 600_000
+ARGON2_DEFAULT = {"iterations": 3, "memory": 64, "parallelism": 4}
+ARGON2_MIN = {"iterations": 2, "memory": 16, "parallelism": 1}
+
+DEFAULT_PBKDF2_GRID = (100_000, 350_000, 600_000, 1_000_000)
+DEFAULT_ARGON2_GRID = {"memory": (16, 32, 64), "iterations": (2, 3), "parallelism": (1, 4)}
+
+_derive = derive_master_key.__wrapped__  # bypass the per-process key cache
+
+
+def pbkdf2_config(iterations) -> dict:
+    return {"kdf": KDF_PBKDF2, "iterations": iterations, "memory": None, "parallelism": None}
+
+
+def argon2_config(iterations, memory, parallelism) -> dict:
+    return {
+        "kdf": KDF_ARGON2ID,
+        "iterations": iterations,
+        "memory": memory,
+        "parallelism": parallelism,
+    }
+
+
+def config_grid(pbkdf2=DEFAULT_PBKDF2_GRID, memory=(), iterations=(), parallelism=()) -> list:
+    configs = [pbkdf2_config(i) for i in pbkdf2]
+    for m in memory:
+        for t in iterations:
+            for p in parallelism:
+                configs.append(argon2_config(t, m, p))
+    return configs
+
+
+def label(config) -> str:
+    if config["kdf"] == KDF_PBKDF2:
+        return f"pbkdf2 i={config['iterations']}"
+    return f"argon2id m={config['memory']}MiB t={config['iterations']} p={config['parallelism']}"
+
+
+def meets_minimum(config) -> bool:
+    if config["kdf"] == KDF_PBKDF2:
+        return config["iterations"] >= PBKDF2_MIN
+    return all(config[k] >= v for k, v in ARGON2_MIN.items())
+
+
+def _timed_derive(config, seq=0) -> float:
+    # distinct passwords so nothing below us can short-circuit a repeat
+    t0 = time.perf_counter()
+    _derive(
+        f"bench-{seq}",
+        "kdf-bench@example.com",
+        config["kdf"],
+        config["iterations"],
+        config["memory"],
+        config["parallelism"],
+    )
+    return (time.perf_counter() - t0) * 1000
+
+
+def _ms_stats(samples) -> dict:
+    return {
+        "min": round(min(samples), 2),
+        "p50": round(statistics.median(samples), 2),
+        "max": round(max(samples), 2),
+    }
+
+
+def bench_single(config, repeat=3) -> dict:
+    _timed_derive(config, -1)  # warm-up (allocator, code paths)
+    samples = [_timed_derive(config, i) for i in range(repeat)]
+    stats = _ms_stats(samples)
+    stats["per_s"] = round(1000 / stats["p50"], 2) if stats["p50"] else None
+    return stats
+
+
+def bench_multi(config, executor, workers, repeat=3) -> dict:
+    n = workers * repeat
+    # one discarded derive per worker first, so process spawn and import
+    # time stay out of per_s
+    list(executor.map(_timed_derive, [config] * workers, range(-workers, 0)))
+    t0 = time.perf_counter()
+    samples = list(executor.map(_timed_derive, [config] * n, range(n)))
+    elapsed = time.perf_counter() - t0
+    stats = _ms_stats(samples)
+    stats["per_s"] = round(n / elapsed, 2)
+    stats["workers"] = workers
+    return stats
+
+
+def recommend(results, budget_ms) -> dict:
+    """Per KDF, the strongest measured configuration whose single-run p50 fits the budget."""
+
+    def strength(config):
+        if config["kdf"] == KDF_PBKDF2:
+            return (config["iterations"],)
+        return (config["memory"] * config["iterations"], config["parallelism"])
+
+    out = {}
+    for kdf, name in ((KDF_PBKDF2, "pbkdf2"), (KDF_ARGON2ID, "argon2id")):
+        measured = [r for r in results if r["config"]["kdf"] == kdf]
+        if not measured:
+            continue
+        fitting = [r for r in measured if r["single"]["p50"] <= budget_ms]
+        if not fitting:
+            fastest = min(measured, key=lambda r: r["single"]["p50"])
+            out[name] = {
+                "config": None,
+                "note": f"nothing fits {budget_ms} ms; fastest is {fastest['label']} "
+                f"at {fastest['single']['p50']} ms",
+            }
+            continue
+        best = max(fitting, key=lambda r: strength(r["config"]))
+        out[name] = {
+            "config": best["config"],
+            "label": best["label"],
+            "single_p50_ms": best["single"]["p50"],
+            "meets_minimum": best["meets_minimum"],
+        }
+        if kdf == KDF_PBKDF2:
+            # iterations scale linearly: extrapolate what the budget would allow
+            per_iter = best["single"]["p50"] / best["config"]["iterations"]
+            out[name]["max_iterations_in_budget"] = int(budget_ms / per_iter) // 10_000 * 10_000
+    return out
+
+
+def run_kdf_benchmark(configs, budget_ms=500.0, repeat=3, workers=None) -> dict:
+    workers = workers or os.cpu_count() or 1
+    started_at = datetime.now(UTC).isoformat(timespec="seconds")
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for config in configs:
+            results.append(
+                {
+                    "config": config,
+                    "label": label(config),
+                    "meets_minimum": meets_minimum(config),
+                    "single": bench_single(config, repeat),
+                    "multi": bench_multi(config, executor, workers, repeat),
+                }
+            )
+    return {
+        "meta": {
+            "started_at": started_at,
+            "cpu_count": os.cpu_count(),
+            "workers": workers,
+            "repeat": repeat,
+            "budget_ms": budget_ms,
+        },
+        "results": results,
+        "recommendations": recommend(results, budget_ms),
+    }
+
+
+def _int_list(s):
+    return tuple(int(x) for x in s.split(",") if x.strip())
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(description="PBKDF2 / Argon2id key-derivation benchmark")
+    p.add_argument("--pbkdf2", default=",".join(map(str, DEFAULT_PBKDF2_GRID)))
+    p.add_argument("--argon2-memory", default="16,32,64", help="MiB")
+    p.add_argument("--argon2-iterations", default="2,3")
+    p.add_argument("--argon2-parallelism", default="1,4")
+    p.add_argument("--repeat", type=int, default=3, help="derivations per config and worker")
+    p.add_argument("--workers", type=int, help="parallel processes (default: all cores)")
+    p.add_argument("--budget-ms", type=float, default=500.0)
+    p.add_argument("--out", help="write the JSON report here as well as stdout")
+    args = p.parse_args(argv)
+
+    configs = config_grid(
+        _int_list(args.pbkdf2),
+        _int_list(args.argon2_memory),
+        _int_list(args.argon2_iterations),
+        _int_list(args.argon2_parallelism),
+    )
+    report = run_kdf_benchmark(configs, args.budget_ms, args.repeat, args.workers)
+    for r in report["results"]:
+        print(
+            f"{r['label']:<36} single p50 {r['single']['p50']:>9.1f} ms  "
+            f"multi {r['multi']['per_s']:>8.1f}/s",
+            file=sys.stderr,
+        )
+    if args.out:
+        write_report(report, args.out)
+    json.dump(report, sys.stdout, indent=2, sort_keys=True)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
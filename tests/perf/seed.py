@@ -0,0 +1,172 @@
+# tests/perf/seed.py
+"""
+API-driven bulk vault seeding for large-vault scenarios.
+
+    python -m tests.perf.seed seed --count 10000 --kinds login,note,card --workers 8
+    python -m tests.perf.seed teardown --manifest reports/seed-manifest.json
+
+Items carry placeholder ciphertext unless `--encrypt` is given, which
+encrypts them under the account's user key (VW_EMAIL/VW_PASSWORD must be the
+API key's account) so the web vault and content-level tests can read them.
+
+Every seeded cipher goes into one dedicated folder, so teardown can find
+them even if a seeding run crashed before writing its manifest. Teardown
+uses the bulk `DELETE /api/ciphers` endpoint in chunks.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from tests.common.ciphers import KINDS, build_cipher, placeholder_encstring
+from tests.common.client import VaultwardenClient
+from tests.common.envtools import resolve_api_credentials
+from tests.common.vault_crypto import VaultKeys
+
+DEFAULT_MANIFEST = "reports/seed-manifest.json"
+
+
+class VaultSeeder:
+    """Create/delete ciphers in bulk for one account using client_credentials auth."""
+
+    def __init__(self, url, client_id, client_secret, workers=8, batch_size=200, encrypt=None):
+        self.client = VaultwardenClient(url, client_id, client_secret, pool_size=workers)
+        self.workers = workers
+        self.batch_size = batch_size
+        self.encrypt = encrypt or placeholder_encstring
+        # manifest of the current/last seed() call, live while it runs, so a caller
+        # can still tear down whatever a failed or interrupted run created
+        self.manifest = None
+
+    def _check(self, r, what):
+        if r.status_code >= 400:
+            raise RuntimeError(f"{what} failed {r.status_code}: {r.text[:300]}")
+        return r
+
+    def create_folder(self, run_id: str) -> str:
+        r = self.client.post(
+            "/api/folders", auth=True, json={"name": self.encrypt(f"seed-{run_id}")}
+        )
+        return self._check(r, "Create folder").json()["id"]
+
+    def _create(self, payload) -> str:
+        r = self.client.post("/api/ciphers", auth=True, json=payload)
+        return self._check(r, "Create cipher").json()["id"]
+
+    def seed(self, count: int, kinds=KINDS, manifest_path=DEFAULT_MANIFEST, progress=None):
+        """
+        Create `count` ciphers cycling through `kinds`; returns the manifest dict.
+        If this raises, `self.manifest` still holds the partial run for teardown().
+        """
+        self.manifest = None
+        run_id = uuid.uuid4().hex[:8]
+        folder_id = self.create_folder(run_id)
+        manifest = self.manifest = {
+            "url": self.client.base_url,
+            "run_id": run_id,
+            "folder_id": folder_id,
+            "ids": [],
+        }
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for lo in range(0, count, self.batch_size):
+                hi = min(lo + self.batch_size, count)
+                payloads = [
+                    build_cipher(kinds[i % len(kinds)], i, run_id, self.encrypt, folder_id)
+                    for i in range(lo, hi)
+                ]
+                manifest["ids"].extend(pool.map(self._create, payloads))
+                # flush after every batch so a crash still leaves a usable manifest
+                if manifest_path:
+                    write_manifest(manifest, manifest_path)
+                if progress:
+                    progress(hi, count, time.perf_counter() - started)
+        manifest["elapsed_s"] = round(time.perf_counter() - started, 3)
+        if manifest_path:
+            write_manifest(manifest, manifest_path)
+        return manifest
+
+    def teardown(self, manifest: dict, chunk_size=500) -> int:
+        """Bulk-delete everything in the manifest (plus its folder); returns items deleted."""
+        ids = set(manifest.get("ids") or [])
+        folder_id = manifest.get("folder_id")
+        if folder_id:
+            # also catch items created after the last manifest flush
+            r = self._check(self.client.get("/api/ciphers", auth=True), "List ciphers")
+            ids.update(c["id"] for c in r.json().get("data", []) if c.get("folderId") == folder_id)
+
+        ids = sorted(ids)
+        for lo in range(0, len(ids), chunk_size):
+            r = self.client.delete(
+                "/api/ciphers", auth=True, json={"ids": ids[lo : lo + chunk_size]}
+            )
+            self._check(r, "Bulk delete")
+        if folder_id:
+            r = self.client.delete(f"/api/folders/{folder_id}", auth=True)
+            if r.status_code != 404:
+                self._check(r, "Delete folder")
+        return len(ids)
+
+
+def write_manifest(manifest: dict, path: str):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    os.replace(tmp, path)
+
+
+def read_manifest(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(description="Bulk-seed or tear down a Vaultwarden vault")
+    sub = p.add_subparsers(dest="cmd", required=True)
+
+    s = sub.add_parser("seed")
+    s.add_argument("--count", type=int, required=True)
+    s.add_argument("--kinds", default=",".join(KINDS))
+    s.add_argument("--workers", type=int, default=8)
+    s.add_argument("--batch-size", type=int, default=200)
+    s.add_argument("--manifest", default=DEFAULT_MANIFEST)
+    s.add_argument(
+        "--encrypt",
+        action="store_true",
+        help="real encryption with the user key of VW_EMAIL/VW_PASSWORD",
+    )
+
+    t = sub.add_parser("teardown")
+    t.add_argument("--manifest", default=DEFAULT_MANIFEST)
+
+    args = p.parse_args(argv)
+    url, cid, csec = resolve_api_credentials()
+
+    if args.cmd == "seed":
+        seeder = VaultSeeder(url, cid, csec, workers=args.workers, batch_size=args.batch_size)
+        if args.encrypt:
+            keys = VaultKeys(seeder.client, os.getenv("VW_EMAIL", ""), os.getenv("VW_PASSWORD", ""))
+            keys.user_key  # derive once up front; fails fast on a wrong password
+            seeder.encrypt = keys.encrypt
+        kinds = tuple(k.strip() for k in args.kinds.split(",") if k.strip())
+
+        def progress(done, total, elapsed):
+            print(f"seeded {done}/{total} ({done / elapsed:.1f}/s)", file=sys.stderr)
+
+        m = seeder.seed(args.count, kinds, args.manifest, progress=progress)
+        print(json.dumps({"created": len(m["ids"]), "elapsed_s": m["elapsed_s"]}))
+    else:
+        manifest = read_manifest(args.manifest)
+        deleted = VaultSeeder(url, cid, csec).teardown(manifest)
+        os.remove(args.manifest)
+        print(json.dumps({"deleted": deleted}))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
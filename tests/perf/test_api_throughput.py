@@ -0,0 +1,43 @@
+# tests/perf/test_api_throughput.py
+import asyncio
+import os
+
+import pytest
+
+from tests.common.envtools import resolve_api_credentials
+from tests.perf.bench import run_benchmark, write_report
+
+CONCURRENCY = int(os.getenv("VW_PERF_CONCURRENCY", "10"))
+DURATION = float(os.getenv("VW_PERF_DURATION", "10"))
+RAMP_UP = float(os.getenv("VW_PERF_RAMP_UP", "2"))
+MAX_ERROR_RATE = float(os.getenv("VW_PERF_MAX_ERROR_RATE", "0.01"))
+P95_BUDGET_MS = os.getenv("VW_PERF_P95_BUDGET_MS")  # optional latency guard
+
+
+def test_api_throughput(seeded_vault):
+    url, cid, csec = resolve_api_credentials()
+    if not cid or not csec:
+        pytest.skip("CLIENT_ID/CLIENT_SECRET missing in env")
+
+    report = asyncio.run(
+        run_benchmark(
+            url.rstrip("/"),
+            cid,
+            csec,
+            concurrency=CONCURRENCY,
+            duration=DURATION,
+            ramp_up=RAMP_UP,
+        )
+    )
+    write_report(report, os.getenv("VW_PERF_REPORT", "reports/perf-api.json"))
+
+    overall = report["overall"]
+    assert overall["requests"] > 0, "Benchmark issued no requests"
+    for name, stats in report["endpoints"].items():
+        assert stats["error_rate"] <= MAX_ERROR_RATE, (
+            f"{name}: error rate {stats['error_rate']} > {MAX_ERROR_RATE}"
+        )
+    if P95_BUDGET_MS:
+        assert overall["latency_ms"]["p95"] <= float(P95_BUDGET_MS), (
+            f"p95 {overall['latency_ms']['p95']}ms exceeds budget {P95_BUDGET_MS}ms"
+        )
@@ -0,0 +1,35 @@
+# tests/perf/test_decrypt_cost.py
+import os
+import time
+
+import pytest
+import requests
+
+from tests.common.client import get_client
+from tests.common.envtools import resolve_api_credentials
+from tests.common.vault_crypto import VaultCryptoError, VaultKeys
+
+# full-vault decryption must stay under this many ms per item
+DECRYPT_BUDGET_MS = float(os.getenv("VW_DECRYPT_BUDGET_MS", "2"))
+
+
+def test_vault_decrypt_cost(seeded_vault):
+    url, cid, csec = resolve_api_credentials()
+    email, password = os.getenv("VW_EMAIL"), os.getenv("VW_PASSWORD")
+    if not cid or not csec or not email or not password:
+        pytest.skip("CLIENT_ID/CLIENT_SECRET/VW_EMAIL/VW_PASSWORD missing in env")
+    client = get_client(url, cid, csec)
+    keys = VaultKeys(client, email, password)
+    try:
+        keys.user_key  # KDF outside the timed window
+    except (VaultCryptoError, requests.RequestException, KeyError, TypeError) as e:
+        pytest.skip(f"user key not derivable for {email}: {e}")
+
+    ciphers = list(client.iter_api_items("/ciphers", "data"))
+    t0 = time.perf_counter()
+    keys.decrypt_ciphers(ciphers)
+    per_item_ms = (time.perf_counter() - t0) * 1000 / max(len(ciphers), 1)
+    assert per_item_ms <= DECRYPT_BUDGET_MS, (
+        f"Decrypting {len(ciphers)} ciphers took {per_item_ms:.2f} ms/item "
+        f"(budget {DECRYPT_BUDGET_MS} ms)"
+    )
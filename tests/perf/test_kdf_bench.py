@@ -0,0 +1,64 @@
+# tests/perf/test_kdf_bench.py
+import os
+
+import pytest
+import requests
+
+from tests.common.client import get_client
+from tests.common.envtools import resolve_api_credentials
+from tests.common.vault_crypto import VaultKeys
+from tests.perf.bench import write_report
+from tests.perf.kdf_bench import (
+    ARGON2_DEFAULT,
+    PBKDF2_DEFAULT,
+    argon2_config,
+    bench_single,
+    config_grid,
+    label,
+    pbkdf2_config,
+    run_kdf_benchmark,
+)
+
+BUDGET_MS = float(os.getenv("VW_KDF_BUDGET_MS", "500"))
+REPEAT = int(os.getenv("VW_KDF_REPEAT", "2"))
+
+
+def test_kdf_grid_report():
+    configs = config_grid(
+        (100_000, PBKDF2_DEFAULT), memory=(16, 64), iterations=(2, 3), parallelism=(1, 4)
+    )
+    report = run_kdf_benchmark(configs, BUDGET_MS, REPEAT)
+    write_report(report, os.getenv("VW_KDF_REPORT", "reports/kdf-bench.json"))
+
+    assert len(report["results"]) == len(configs)
+    for r in report["results"]:
+        assert r["single"]["p50"] > 0 and r["multi"]["per_s"] > 0, f"{r['label']} not measured"
+    assert set(report["recommendations"]) == {"pbkdf2", "argon2id"}
+
+
+# Bitwarden's defaults must keep a login inside the budget on this machine
+@pytest.mark.parametrize(
+    "config",
+    [
+        pbkdf2_config(PBKDF2_DEFAULT),
+        argon2_config(**ARGON2_DEFAULT),
+    ],
+    ids=label,
+)
+def test_default_kdf_within_budget(config):
+    p50 = bench_single(config, REPEAT)["p50"]
+    assert p50 <= BUDGET_MS, f"{label(config)}: {p50} ms per derivation > {BUDGET_MS} ms"
+
+
+# ...and so must the test account's actual settings
+def test_account_kdf_within_budget():
+    url, cid, csec = resolve_api_credentials()
+    email = os.getenv("VW_EMAIL")
+    if not email:
+        pytest.skip("VW_EMAIL missing in env")
+    try:
+        params = VaultKeys(get_client(url, cid, csec), email, "").kdf_params()
+    except requests.RequestException as e:
+        pytest.skip(f"prelogin unavailable: {e}")
+    p50 = bench_single(params, REPEAT)["p50"]
+    assert p50 <= BUDGET_MS, f"{email}: {label(params)} takes {p50} ms > {BUDGET_MS} ms"
@@ -0,0 +1,66 @@
+# tests/perf/test_sync_cost.py
+import os
+import statistics
+
+import pytest
+
+from tests.common.envtools import resolve_api_credentials
+from tests.common.sync import SyncClient
+from tests.perf.bench import write_report
+from tests.perf.seed import VaultSeeder
+
+# vault growth (items added on top of the current vault) to measure sync at
+STEPS = [int(s) for s in os.getenv("VW_SYNC_STEPS", "0,250,1000").split(",") if s.strip()]
+REPEAT = int(os.getenv("VW_SYNC_REPEAT", "3"))
+MAX_BYTES_PER_ITEM = float(os.getenv("VW_SYNC_MAX_BYTES_PER_ITEM", "4096"))
+BUDGET_MS = os.getenv("VW_SYNC_BUDGET_MS")  # optional guard on the largest step
+
+
+def measure(syncer) -> dict:
+    full = [syncer.sync(force=True) for _ in range(REPEAT)]
+    cached = syncer.sync()
+    return {
+        "items": len(full[-1].ciphers),
+        "bytes": full[-1].size_bytes,
+        "full_ms": round(statistics.median(r.elapsed_ms for r in full), 2),
+        "cached_ms": cached.elapsed_ms,
+        "cache_hit": cached.from_cache,
+    }
+
+
+def test_sync_cost_as_vault_grows(tmp_path):
+    url, cid, csec = resolve_api_credentials()
+    if not cid or not csec:
+        pytest.skip("CLIENT_ID/CLIENT_SECRET missing in env")
+    seeder = VaultSeeder(url, cid, csec, workers=int(os.getenv("VW_SEED_WORKERS", "8")))
+    syncer = SyncClient(seeder.client, cache_dir=str(tmp_path))
+
+    manifests, points, added = [], [], 0
+    try:
+        for step in sorted(STEPS):
+            if step > added:
+                try:
+                    seeder.seed(step - added, manifest_path=None)
+                finally:
+                    # partial too: a failed step still leaves its folder + items
+                    if seeder.manifest:
+                        manifests.append(seeder.manifest)
+                added = step
+            points.append({"added": added, **measure(syncer)})
+    finally:
+        for m in manifests:
+            seeder.teardown(m)
+    write_report({"steps": points}, os.getenv("VW_SYNC_REPORT", "reports/sync-cost.json"))
+
+    for p in points:
+        assert p["cache_hit"], f"Unchanged vault re-downloaded at {p['items']} items"
+    first, last = points[0], points[-1]
+    if last["items"] > first["items"]:
+        per_item = (last["bytes"] - first["bytes"]) / (last["items"] - first["items"])
+        assert per_item <= MAX_BYTES_PER_ITEM, (
+            f"Sync grows {per_item:.0f} B per item (limit {MAX_BYTES_PER_ITEM:.0f})"
+        )
+    if BUDGET_MS:
+        assert last["full_ms"] <= float(BUDGET_MS), (
+            f"Sync of {last['items']} items took {last['full_ms']} ms > {BUDGET_MS} ms"
+        )
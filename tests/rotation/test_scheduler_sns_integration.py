@@ -1,18 +1,34 @@
+import atexit
 import os
+import shutil
 import subprocess
 import time
+import uuid
 from datetime import UTC, datetime, timedelta
+from urllib.parse import urlsplit, urlunsplit
 
 import boto3
 import pytest
-import requests
 from dotenv import find_dotenv, load_dotenv
 
+from tests.common.client import get_client
+from tests.common.envtools import env_flag
+
+try:
+    from moto.server import ThreadedMotoServer
+except ImportError:
+    ThreadedMotoServer = None
+
 load_dotenv(find_dotenv(), override=False)
 
-# Make sure no stray LocalStack/custom endpoint is used
-for v in ("AWS_ENDPOINT_URL", "AWS_ENDPOINT"):
-    os.environ.pop(v, None)
+# ROTATION_LOCAL_AWS=1: SNS/SQS go to a local stand-in instead of AWS. That is
+# AWS_ENDPOINT_URL when set (moto server, LocalStack), else moto started in-process.
+LOCAL_AWS = env_flag("ROTATION_LOCAL_AWS")
+
+if not LOCAL_AWS:
+    # Make sure no stray LocalStack/custom endpoint is used
+    for v in ("AWS_ENDPOINT_URL", "AWS_ENDPOINT"):
+        os.environ.pop(v, None)
 
 VAULTWARDEN_URL = os.getenv("VAULTWARDEN_URL", "http://localhost:3000").rstrip("/")
 CLIENT_ID = os.getenv("CLIENT_ID")
@@ -26,17 +42,70 @@ SCHED_IMAGE = os.getenv("ROTATION_IMAGE", "hadiserhan/vw-rotation:latest")
 # force candidates so a publish happens
 FREQ_DAYS = os.getenv("ROTATION_FREQUENCY_DAYS", "0")
 GRACE_DAYS = os.getenv("ROTATION_GRACE_PERIOD_DAYS", "0")
+USE_HOST_NETWORK = env_flag("USE_DOCKER_HOST_NETWORK", "1")
+
+_local = {}  # endpoint URLs of the local stand-in, once started
+
+
+def _local_endpoint() -> str:
+    """Endpoint for this process; starts in-process moto on first use if none is configured."""
+    if "url" not in _local:
+        url = os.getenv("AWS_ENDPOINT_URL")
+        if not url:
+            if ThreadedMotoServer is None:
+                pytest.skip("ROTATION_LOCAL_AWS needs AWS_ENDPOINT_URL or moto[server]")
+            # bridge-networked containers reach us via the docker host, not loopback
+            server = ThreadedMotoServer(
+                ip_address="127.0.0.1" if USE_HOST_NETWORK else "0.0.0.0", port=0, verbose=False
+            )
+            server.start()
+            atexit.register(server.stop)
+            port = server.get_host_and_port()[1]
+            url = f"http://127.0.0.1:{port}"
+        _local["url"] = url
+        container_url = _container_url(url)
+        if container_url != url:
+            _local["container_url"] = container_url
+    return _local["url"]
+
+
+def _container_url(url: str) -> str:
+    """`url` as the scheduler container sees it: loopback means the docker host off host networking."""
+    parts = urlsplit(url)
+    if USE_HOST_NETWORK or parts.hostname not in ("localhost", "127.0.0.1", "::1", "0.0.0.0"):
+        return url
+    netloc = "host.docker.internal" + (f":{parts.port}" if parts.port else "")
+    return urlunsplit(parts._replace(netloc=netloc))
+
+
+def _aws_kwargs() -> dict:
+    kwargs = {"region_name": AWS_REGION}
+    if LOCAL_AWS:
+        kwargs.update(
+            endpoint_url=_local_endpoint(),
+            aws_access_key_id="testing",
+            aws_secret_access_key="testing",
+        )
+    return kwargs
 
 
 def _sns():
-    return boto3.client("sns", region_name=AWS_REGION)
+    return boto3.client("sns", **_aws_kwargs())
 
 
 def _cw():
-    return boto3.client("cloudwatch", region_name=AWS_REGION)
+    return boto3.client("cloudwatch", **_aws_kwargs())
+
+
+def _sqs():
+    return boto3.client("sqs", **_aws_kwargs())
 
 
 def _resolve_topic_arn() -> str:
+    if LOCAL_AWS:
+        # the stand-in starts empty: (re)create the topic under the configured name
+        name = TOPIC_NAME or (TOPIC_ARN or "vw-rotation").split(":")[-1]
+        return _sns().create_topic(Name=name)["TopicArn"]
     if TOPIC_ARN:
         return TOPIC_ARN
     if not TOPIC_NAME:
@@ -72,6 +141,40 @@ def _get_publish_count(topic_name: str, start: datetime, end: datetime) -> float
     return sum(dp.get("Sum", 0.0) for dp in resp.get("Datapoints", []))
 
 
+def _subscribe_queue(topic_arn: str) -> str:
+    """A fresh SQS queue subscribed (raw delivery) to the topic: its message log."""
+    sqs = _sqs()
+    name = f"{_topic_name_from_arn(topic_arn)}-verify-{uuid.uuid4().hex[:8]}"
+    queue_url = sqs.create_queue(QueueName=name)["QueueUrl"]
+    queue_arn = sqs.get_queue_attributes(QueueUrl=queue_url, AttributeNames=["QueueArn"])[
+        "Attributes"
+    ]["QueueArn"]
+    _sns().subscribe(
+        TopicArn=topic_arn,
+        Protocol="sqs",
+        Endpoint=queue_arn,
+        Attributes={"RawMessageDelivery": "true"},
+    )
+    return queue_url
+
+
+def _drain_queue(queue_url: str, wait_s: float = 5) -> list:
+    """Message bodies delivered so far; long-polls up to `wait_s` for the first one."""
+    sqs = _sqs()
+    bodies = []
+    deadline = time.time() + wait_s
+    while True:
+        resp = sqs.receive_message(
+            QueueUrl=queue_url,
+            MaxNumberOfMessages=10,
+            WaitTimeSeconds=0 if bodies else max(1, min(int(deadline - time.time()), 20)),
+        )
+        msgs = resp.get("Messages", [])
+        bodies += [m["Body"] for m in msgs]
+        if not msgs and (bodies or time.time() >= deadline):
+            return bodies
+
+
 def _run_scheduler_once(topic_arn: str):
     env = {
         "VAULTWARDEN_URL": VAULTWARDEN_URL,
@@ -88,18 +191,25 @@ def _run_scheduler_once(topic_arn: str):
         "AWS_EC2_METADATA_DISABLED": "true",
     }
 
-    # pass AWS creds if set in the host env or .env
-    for k in ("AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY", "AWS_SESSION_TOKEN"):
-        v = os.getenv(k)
-        if v:
-            env[k] = v
+    if LOCAL_AWS:
+        # boto3 in the container honours AWS_ENDPOINT_URL; never hand it real creds
+        env["AWS_ENDPOINT_URL"] = _local.get("container_url") or _local_endpoint()
+        env["AWS_ACCESS_KEY_ID"] = env["AWS_SECRET_ACCESS_KEY"] = "testing"
+    else:
+        # pass AWS creds if set in the host env or .env
+        for k in ("AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY", "AWS_SESSION_TOKEN"):
+            v = os.getenv(k)
+            if v:
+                env[k] = v
 
     args = ["docker", "run", "--rm"]
     for k, v in env.items():
         args += ["-e", f"{k}={v}"]
 
-    if os.getenv("USE_DOCKER_HOST_NETWORK", "1").lower() in ("1", "true", "yes"):
+    if USE_HOST_NETWORK:
         args.append("--network=host")
+    elif "container_url" in _local:
+        args.append("--add-host=host.docker.internal:host-gateway")
 
     args.append(SCHED_IMAGE)
 
@@ -110,15 +220,20 @@ def _run_scheduler_once(topic_arn: str):
         )
 
 
-def test_sns_metric_increases_after_scheduler_run():
+def _require_vaultwarden():
     if not CLIENT_ID or not CLIENT_SECRET:
         pytest.skip("CLIENT_ID/CLIENT_SECRET missing in env")
 
     try:
-        assert requests.get(f"{VAULTWARDEN_URL}/alive", timeout=5).status_code == 200
+        assert get_client(VAULTWARDEN_URL).get("/alive", timeout=5).status_code == 200
     except Exception as e:
         pytest.skip(f"Vaultwarden not reachable: {e}")
 
+
+@pytest.mark.skipif(LOCAL_AWS, reason="CloudWatch metrics need real AWS; see the local test")
+def test_sns_metric_increases_after_scheduler_run():
+    _require_vaultwarden()
+
     topic_arn = _resolve_topic_arn()
     topic_name = _topic_name_from_arn(topic_arn)
 
@@ -141,3 +256,21 @@ def test_sns_metric_increases_after_scheduler_run():
     assert last_val >= baseline + 1, (
         f"SNS metric didn't increase. baseline={baseline}, latest={last_val}, topic={topic_name}"
     )
+
+
+# Offline variant: read the publishes straight off the stand-in topic
+@pytest.mark.skipif(not LOCAL_AWS, reason="set ROTATION_LOCAL_AWS=1 for the local stand-in")
+def test_scheduler_publishes_to_local_topic():
+    _require_vaultwarden()
+    if shutil.which("docker") is None:
+        pytest.skip("docker not available to run the scheduler image")
+
+    topic_arn = _resolve_topic_arn()
+    queue_url = _subscribe_queue(topic_arn)
+    assert _drain_queue(queue_url, wait_s=1) == [], "Topic log not empty before the run"
+
+    _run_scheduler_once(topic_arn)
+
+    published = _drain_queue(queue_url)
+    assert published, f"Scheduler published nothing to {topic_arn}"
+    assert all(body.strip() for body in published), f"Empty SNS message in {published}"
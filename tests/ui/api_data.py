@@ -0,0 +1,77 @@
+# tests/ui/api_data.py
+import threading
+
+import requests
+
+from tests.common.client import get_client
+from tests.common.envtools import resolve_api_credentials
+from tests.common.vault_crypto import VaultCryptoError, VaultKeys
+
+
+class ApiVaultData:
+    """
+    Creates UI-test preconditions straight through the API (client-credentials
+    auth, fields encrypted with the account's user key so the web vault can
+    decrypt them) and removes them again afterwards.
+    """
+
+    def __init__(self, base_url, email, password):
+        url, cid, csec = resolve_api_credentials()
+        self.client = get_client(base_url or url, cid, csec) if cid and csec else None
+        self.keys = VaultKeys(self.client, email, password) if self.client else None
+        self._available = None
+
+    @property
+    def available(self) -> bool:
+        """True when the API key exists and belongs to this UI user (keys derivable)."""
+        if self._available is None:
+            try:
+                self._available = self.keys is not None and self.keys.user_key is not None
+            except (VaultCryptoError, requests.RequestException, KeyError, TypeError):
+                self._available = False
+        return self._available
+
+    def create_login(self, name, username=None, password=None, uri=None) -> str:
+        enc = self.keys.encrypt
+        body = {
+            "type": 1,
+            "name": enc(name),
+            "notes": None,
+            "favorite": False,
+            "folderId": None,
+            "organizationId": None,
+            "reprompt": 0,
+            "fields": [],
+            "passwordHistory": [],
+            "login": {
+                "username": enc(username),
+                "password": enc(password),
+                "totp": None,
+                "uris": [{"uri": enc(uri), "match": None}] if uri else [],
+            },
+        }
+        r = self.client.post("/api/ciphers", auth=True, json=body)
+        r.raise_for_status()
+        return r.json()["id"]
+
+    def move_to_trash(self, cipher_id):
+        self.client.put(f"/api/ciphers/{cipher_id}/delete", auth=True).raise_for_status()
+
+    def purge(self, cipher_id):
+        """Permanently delete; already-gone items are fine."""
+        r = self.client.delete(f"/api/ciphers/{cipher_id}", auth=True)
+        if r.status_code not in (200, 204, 404):
+            r.raise_for_status()
+
+
+_data = {}
+_data_lock = threading.Lock()
+
+
+def api_vault_data(base_url, email, password) -> ApiVaultData:
+    """Process-wide ApiVaultData per (base_url, email); keys are derived once."""
+    with _data_lock:
+        data = _data.get((base_url, email))
+        if data is None:
+            data = _data[(base_url, email)] = ApiVaultData(base_url, email, password)
+        return data
@@ -0,0 +1,209 @@
+# tests/ui/auth_state.py
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from tests.common.envtools import env_flag
+
+# Dump local/session storage plus every IndexedDB store (JSON-safe values only)
+_CAPTURE_JS = r"""
+const done = arguments[arguments.length - 1];
+const dump = (s) => { const o = {}; for (let i = 0; i < s.length; i++) { const k = s.key(i); o[k] = s.getItem(k); } return o; };
+const out = { localStorage: dump(localStorage), sessionStorage: dump(sessionStorage), indexedDB: {} };
+const readDb = (name) => new Promise((resolve) => {
+  const req = indexedDB.open(name);
+  req.onerror = () => resolve();
+  req.onsuccess = () => {
+    const db = req.result, stores = Array.from(db.objectStoreNames), dbOut = {};
+    if (!stores.length) { db.close(); return resolve(); }
+    const tx = db.transaction(stores, 'readonly');
+    stores.forEach((st) => {
+      dbOut[st] = [];
+      const cur = tx.objectStore(st).openCursor();
+      cur.onsuccess = () => {
+        const c = cur.result;
+        if (!c) return;
+        try { dbOut[st].push([JSON.parse(JSON.stringify(c.key)), JSON.parse(JSON.stringify(c.value))]); } catch (e) {}
+        c.continue();
+      };
+    });
+    tx.oncomplete = () => { out.indexedDB[name] = dbOut; db.close(); resolve(); };
+    tx.onerror = () => { db.close(); resolve(); };
+  };
+});
+(indexedDB.databases ? indexedDB.databases() : Promise.resolve([]))
+  .then((dbs) => Promise.all(dbs.map((d) => readDb(d.name))))
+  .then(() => done(out), () => done(out));
+"""
+
+_RESTORE_JS = r"""
+const state = arguments[0], done = arguments[arguments.length - 1];
+localStorage.clear(); sessionStorage.clear();
+for (const [k, v] of Object.entries(state.localStorage || {})) localStorage.setItem(k, v);
+for (const [k, v] of Object.entries(state.sessionStorage || {})) sessionStorage.setItem(k, v);
+const writeDb = (name, stores) => new Promise((resolve) => {
+  const names = Object.keys(stores);
+  if (!names.length) return resolve();
+  const req = indexedDB.open(name);
+  req.onupgradeneeded = () => names.forEach((st) => {
+    if (!req.result.objectStoreNames.contains(st)) req.result.createObjectStore(st);
+  });
+  req.onerror = () => resolve();
+  req.onsuccess = () => {
+    const db = req.result;
+    try {
+      const tx = db.transaction(names.filter((n) => db.objectStoreNames.contains(n)), 'readwrite');
+      names.forEach((st) => {
+        if (!db.objectStoreNames.contains(st)) return;
+        const os = tx.objectStore(st);
+        (stores[st] || []).forEach(([k, v]) => { try { os.keyPath ? os.put(v) : os.put(v, k); } catch (e) {} });
+      });
+      tx.oncomplete = () => { db.close(); resolve(); };
+      tx.onerror = () => { db.close(); resolve(); };
+    } catch (e) { db.close(); resolve(); }
+  };
+});
+Promise.all(Object.entries(state.indexedDB || {}).map(([n, s]) => writeDb(n, s)))
+  .then(() => done(true), () => done(false));
+"""
+
+_VAULT_READY = (By.XPATH, "//table|//button[contains(.,'New item')]")
+_LOGIN_FORM = (By.XPATH, "//input[@type='email']|//input[@formcontrolname='masterPassword']")
+
+
+def snapshots_enabled() -> bool:
+    return env_flag("VW_AUTH_SNAPSHOT", "1")
+
+
+def open_snapshot_dir():
+    """
+    Private (0700) directory for this test run's snapshots, handed to xdist
+    workers through VW_AUTH_SNAPSHOT_DIR. Returns the path when this call
+    created it (the caller removes it with close_snapshot_dir), else None.
+    """
+    if os.getenv("VW_AUTH_SNAPSHOT_DIR"):
+        return None
+    path = tempfile.mkdtemp(prefix="vw_auth_")
+    os.environ["VW_AUTH_SNAPSHOT_DIR"] = path
+    return path
+
+
+def close_snapshot_dir(path):
+    shutil.rmtree(path, ignore_errors=True)
+    if os.environ.get("VW_AUTH_SNAPSHOT_DIR") == path:
+        del os.environ["VW_AUTH_SNAPSHOT_DIR"]
+
+
+class AuthSnapshotStore:
+    """
+    Authenticated browser state per (base_url, email): in memory, plus a 0600
+    file in the run's snapshot directory (VW_AUTH_SNAPSHOT_DIR, removed when
+    the run ends) so other workers and later browser launches can skip the
+    login + client-side KDF. Without that directory it stays in memory.
+    Snapshots expire after VW_AUTH_SNAPSHOT_TTL seconds (default 1800).
+    """
+
+    def __init__(self, ttl=None):
+        self.ttl = ttl if ttl is not None else float(os.getenv("VW_AUTH_SNAPSHOT_TTL", "1800"))
+        self._mem = {}
+        self._lock = threading.Lock()
+
+    def _path(self, base_url, email):
+        directory = os.getenv("VW_AUTH_SNAPSHOT_DIR")
+        if not directory:
+            return None
+        key = hashlib.sha256(f"{base_url}|{email.lower()}".encode()).hexdigest()[:16]
+        return os.path.join(directory, f"vw_auth_{key}.json")
+
+    def get(self, base_url, email):
+        with self._lock:
+            snap = self._mem.get((base_url, email))
+            if snap is None:
+                if self._path(base_url, email) is None:
+                    return None
+                try:
+                    with open(self._path(base_url, email), encoding="utf-8") as f:
+                        snap = json.load(f)
+                except (OSError, ValueError):
+                    return None
+            if time.time() - snap.get("at", 0) > self.ttl:
+                return None
+            self._mem[(base_url, email)] = snap
+            return snap
+
+    def put(self, base_url, email, snap):
+        with self._lock:
+            self._mem[(base_url, email)] = snap
+            path = self._path(base_url, email)
+            if path is None:
+                return
+            tmp = f"{path}.{os.getpid()}.tmp"  # workers write concurrently
+            try:
+                fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(snap, f)
+                os.replace(tmp, path)
+            except OSError:
+                pass
+
+    def drop(self, base_url, email):
+        with self._lock:
+            self._mem.pop((base_url, email), None)
+            try:
+                os.remove(self._path(base_url, email))
+            except (OSError, TypeError):
+                pass
+
+
+SNAPSHOTS = AuthSnapshotStore()
+
+
+def capture_state(driver) -> dict:
+    """Snapshot cookies + web storage + IndexedDB of the current (signed-in) page."""
+    driver.set_script_timeout(30)
+    state = driver.execute_async_script(_CAPTURE_JS)
+    state["cookies"] = driver.get_cookies()
+    state["at"] = time.time()
+    return state
+
+
+def restore_state(driver, base_url, state, timeout=20) -> bool:
+    """
+    Load `state` into this browser and open the vault.
+    Returns True only if the dashboard renders without a login/lock form.
+    """
+    try:
+        # any same-origin page works as a host for writing storage
+        driver.get(f"{base_url}/alive")
+        for c in state.get("cookies", []):
+            c = {k: v for k, v in c.items() if k in ("name", "value", "path", "secure", "expiry")}
+            try:
+                driver.add_cookie(c)
+            except WebDriverException:
+                pass
+        driver.set_script_timeout(30)
+        if not driver.execute_async_script(_RESTORE_JS, state):
+            return False
+
+        driver.get(f"{base_url}/#/vault")
+        WebDriverWait(driver, timeout).until(
+            EC.any_of(
+                EC.presence_of_element_located(_VAULT_READY),
+                EC.presence_of_element_located(_LOGIN_FORM),
+            )
+        )
+        url = driver.current_url
+        if "#/login" in url or "#/lock" in url or driver.find_elements(*_LOGIN_FORM):
+            return False
+        return "Vault" in (driver.title or "")
+    except (TimeoutException, WebDriverException):
+        return False
@@ -1,113 +1,346 @@
 # tests/ui/base_ui.py
-import atexit
 import os
-import shutil
 import tempfile
 import unittest
+import uuid
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
 
-from tests.common.envtools import headless_default, pick_url
+from tests.common.envtools import env_flag, headless_default, pick_url, worker_id
+from tests.ui.api_data import api_vault_data
+from tests.ui.auth_state import SNAPSHOTS, capture_state, restore_state, snapshots_enabled
+from tests.ui.chromedriver import chrome_service
+from tests.ui.driver_pool import POOL, DriverSession, phase, prewarm_count
+from tests.ui.netcapture import attach_recorder, capture_enabled, detach_recorder, enable_capture
+from tests.ui.pages.base_page import install_idle_hooks
+from tests.ui.pages.dashboard_page import DashboardPage
+from tests.ui.pages.login_page import LoginPage
+from tests.ui.resource_block import apply_blocking, blocking_enabled
+from tests.ui.tracing import TRACER, instrument_driver, tracing_enabled
+
+_VAULT_OR_LOGIN = (
+    "//table|//button[contains(.,'New item')]"
+    "|//input[@type='email']|//input[@formcontrolname='masterPassword']"
+)
+
+
+def reuse_browser() -> bool:
+    """Keep one logged-in Chrome per worker across tests (VW_REUSE_BROWSER=0 to disable)."""
+    return env_flag("VW_REUSE_BROWSER", "1")
+
+
+def api_preconditions() -> bool:
+    """Create UI-test preconditions through the API when possible (VW_API_PRECONDITIONS=0 to disable)."""
+    return env_flag("VW_API_PRECONDITIONS", "1")
+
+
+def chrome_options(profile_dir):
+    """Chrome options shared by every UI browser (headless, no password manager, own profile)."""
+    headless = headless_default()
+    opts = webdriver.ChromeOptions()
+    if headless:
+        opts.add_argument("--headless=new")
+
+    # Disable Chrome password manager + leak detection popups
+    prefs = {
+        "credentials_enable_service": False,
+        "profile.password_manager_enabled": False,
+        "autofill.profile_enabled": False,
+        "autofill.credit_card_enabled": False,
+        "credentials_enable_autosignin": False,
+        "profile.password_manager_leak_detection": False,
+        "password_manager_leak_detection": False,
+    }
+    opts.add_experimental_option("prefs", prefs)
+    opts.add_argument("--disable-save-password-bubble")
+    opts.add_argument("--disable-extensions")  # cuts off GPM UI in many builds
+    opts.add_argument("--disable-component-extensions-with-background-pages")
+    opts.add_argument(
+        "--disable-features=PasswordLeakDetection,PasswordReuseDetection,PasswordManagerOnboarding"
+    )
+
+    # Make ngrok skip the abuse splash (works in CI and locally)
+    is_ci = (
+        os.getenv("GITHUB_ACTIONS", "").lower() == "true" or os.getenv("CI", "").lower() == "true"
+    )
+    ua = "vw-ci-bot/1.0" if is_ci else "vw-local-tester/1.0"
+    opts.add_argument(f"--user-agent={ua}")
+
+    # unique Chrome profile to avoid lock issues
+    opts.add_argument(f"--user-data-dir={profile_dir}")
+
+    # server-friendly flags
+    opts.add_argument("--no-sandbox")
+    opts.add_argument("--disable-dev-shm-usage")
+    opts.add_argument("--window-size=1280,900")
+
+    if capture_enabled():
+        enable_capture(opts)
+    return opts
+
+
+def bypass_ngrok_splash(driver):
+    """Get past ngrok's browser warning page if the current URL is an ngrok tunnel."""
+    try:
+        cur = driver.current_url
+        host = urlparse(cur).netloc
+        if "ngrok-free.app" in host:
+            # Try query param trick (some edges honor it)
+            if "ngrok-skip-browser-warning" not in cur:
+                u = urlparse(cur)
+                q = dict(parse_qsl(u.query))
+                q["ngrok-skip-browser-warning"] = "true"
+                driver.get(urlunparse(u._replace(query=urlencode(q))))
+            # If still showing splash, click "Visit Site"
+            if "Visit Site" in driver.page_source or "ngrok" in (driver.title or "").lower():
+                btn = WebDriverWait(driver, 30).until(
+                    EC.element_to_be_clickable(
+                        (
+                            By.XPATH,
+                            "//*[self::a or self::button][normalize-space()='Visit Site']",
+                        )
+                    )
+                )
+                btn.click()
+    except Exception:
+        # Don’t block tests if bypass fails
+        pass
+
+
+def launch_session(warm_url=None) -> DriverSession:
+    """
+    Start a Chrome session, timing each startup phase into `session.startup`.
+    With `warm_url`, also open its login page (past any ngrok splash) so the
+    session is ready to use when handed out.
+    """
+    timings = {}
+    profile_dir = tempfile.mkdtemp(prefix="vw_chrome_")
+    with phase(timings, "driver_resolve"):
+        service = chrome_service()
+    with phase(timings, "process_launch"):
+        driver = webdriver.Chrome(service=service, options=chrome_options(profile_dir))
+    if blocking_enabled():
+        apply_blocking(driver)
+    install_idle_hooks(driver)
+    session = DriverSession(driver, profile_dir)
+    session.startup = timings
+    if warm_url:
+        try:
+            with phase(timings, "first_navigation"):
+                driver.get(f"{warm_url}/#/login")
+            with phase(timings, "ngrok_bypass"):
+                bypass_ngrok_splash(driver)
+            session.warmed = True
+        except WebDriverException:
+            pass  # still a usable browser; setUp navigates as usual
+    return session
+
+
+def prewarm_launch() -> DriverSession:
+    return launch_session(warm_url=pick_url().rstrip("/"))
 
 
 class BaseVaultwardenTest(unittest.TestCase):
     def setUp(self):
-        headless = headless_default()
-        opts = webdriver.ChromeOptions()
-        if headless:
-            opts.add_argument("--headless=new")
-
-        # Disable Chrome password manager + leak detection popups
-        prefs = {
-            "credentials_enable_service": False,
-            "profile.password_manager_enabled": False,
-            "autofill.profile_enabled": False,
-            "autofill.credit_card_enabled": False,
-            "credentials_enable_autosignin": False,
-            "profile.password_manager_leak_detection": False,
-            "password_manager_leak_detection": False,
-        }
-        opts.add_experimental_option("prefs", prefs)
-        opts.add_argument("--disable-save-password-bubble")
-        opts.add_argument("--disable-extensions")  # cuts off GPM UI in many builds
-        opts.add_argument("--disable-component-extensions-with-background-pages")
-        opts.add_argument(
-            "--disable-features=PasswordLeakDetection,PasswordReuseDetection,PasswordManagerOnboarding"
-        )
+        self.base_url = pick_url().rstrip("/")
+        self._reuse = reuse_browser()
+        self._session = POOL.acquire(self._launch)
+        if not self._reuse:
+            # each test quits its browser: boot the next one while this test runs
+            POOL.prewarm(prewarm_launch, prewarm_count())
+        self.driver = self._session.driver
+        self.wait = WebDriverWait(self.driver, 30)
+        self._profile_dir = self._session.profile_dir
+        self.net = None
+        self._trace_root = None
+        self._vault_stale = False  # items were created behind the web vault's back
+        if tracing_enabled():
+            instrument_driver(self.driver)
+            self._trace_root = TRACER.start(self._test_label(), **{"vw.test": self.id()})
+        try:
+            if capture_enabled():
+                self.net = attach_recorder(self.driver)
+                self.net.reset()  # drop whatever the previous test left in the log
+            self._reset_state()
+        except Exception:
+            # tearDown won't run after a failed setUp; don't leak the browser
+            self._finish_trace()
+            detach_recorder(self.driver)
+            self._session.quit()
+            raise
 
-        # Make ngrok skip the abuse splash (works in CI and locally)
-        is_ci = (
-            os.getenv("GITHUB_ACTIONS", "").lower() == "true"
-            or os.getenv("CI", "").lower() == "true"
-        )
-        ua = "vw-ci-bot/1.0" if is_ci else "vw-local-tester/1.0"
-        opts.add_argument(f"--user-agent={ua}")
+    def tearDown(self):
+        self._finish_trace()
+        if self.net is not None:
+            self.net.attach(self._test_label())
+        if self._reuse and self._session.alive():
+            POOL.release(self._session)
+        else:
+            detach_recorder(self.driver)
+            self._session.quit()
 
-        # unique Chrome profile to avoid lock issues
-        self._profile_dir = tempfile.mkdtemp(prefix="vw_chrome_")
-        opts.add_argument(f"--user-data-dir={self._profile_dir}")
+    def _test_label(self) -> str:
+        return f"{type(self).__name__}.{self._testMethodName}"
 
-        # server-friendly flags
-        opts.add_argument("--no-sandbox")
-        opts.add_argument("--disable-dev-shm-usage")
-        opts.add_argument("--window-size=1280,900")
+    def _finish_trace(self):
+        if self._trace_root is not None:
+            TRACER.end(self._trace_root)
+            TRACER.export(TRACER.drain(), self._test_label())
+            self._trace_root = None
 
-        self.driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()), options=opts
-        )
-        self.wait = WebDriverWait(self.driver, 30)
+    def unique_name(self, prefix: str) -> str:
+        """Item name that can't collide across tests, runs or parallel workers."""
+        return f"{prefix} {worker_id()}-{uuid.uuid4().hex[:6]}"
 
-        # Start at login
-        base_url = pick_url().rstrip("/")
-        self.base_url = base_url
-        login_url = f"{base_url}/#/login"
-        self.driver.get(login_url)
+    def _launch(self) -> DriverSession:
+        return launch_session()
 
+    def _go_to_login(self):
+        startup = self._session.startup
+        first = "first_navigation" not in startup
+        with phase(startup if first else {}, "first_navigation"):
+            self.driver.get(f"{self.base_url}/#/login")
         # If ngrok splash appears, bypass it once
-        self._bypass_ngrok_splash()
+        with phase(startup if first else {}, "ngrok_bypass"):
+            self._bypass_ngrok_splash()
 
-        atexit.register(lambda: shutil.rmtree(self._profile_dir, ignore_errors=True))
+    def _reset_state(self):
+        """Bring a (possibly reused) browser back to a clean starting point."""
+        if not self._session.logged_in_as:
+            if self._session.warmed:
+                self._session.warmed = False  # pre-warmed: already on the login page
+                return
+            self._go_to_login()
+            return
 
-    def tearDown(self):
+        # Reused + signed in: back to the unfiltered vault, close leftovers
+        self.driver.get(f"{self.base_url}/#/vault")
+        page = DashboardPage(self.driver)
+        page._dismiss_dialogs(timeout=2)
         try:
-            self.driver.quit()
-        finally:
-            shutil.rmtree(self._profile_dir, ignore_errors=True)
+            WebDriverWait(self.driver, 15).until(
+                EC.presence_of_element_located((By.XPATH, _VAULT_OR_LOGIN))
+            )
+        except TimeoutException:
+            pass
+        url = self.driver.current_url
+        if "#/login" in url or "#/lock" in url:
+            # session expired/locked server-side; fall back to a real login
+            self._session.logged_in_as = None
+            self._go_to_login()
+        else:
+            page.clear_search()  # a previous test may have left the list filtered
 
-    def _bypass_ngrok_splash(self):
+    def _sign_out(self):
+        """Wipe the browser's auth state (cookies, web storage, IndexedDB)."""
+        self.driver.delete_all_cookies()
+        self.driver.execute_script(
+            "localStorage.clear(); sessionStorage.clear();"
+            "if (indexedDB.databases) indexedDB.databases()"
+            ".then(dbs => dbs.forEach(d => indexedDB.deleteDatabase(d.name)));"
+        )
+        self._session.logged_in_as = None
+        self._go_to_login()
+
+    def login(self, email, password, fresh=False) -> DashboardPage:
+        """
+        Return the dashboard signed in as `email`: reuse the pooled browser's
+        session, else restore a stored auth snapshot, else run the real login
+        flow and snapshot it. fresh=True always runs the real flow.
+        """
+        if self._session.logged_in_as == email and not fresh:
+            if not self._vault_stale or self._reload_vault():
+                self._vault_stale = False
+                return DashboardPage(self.driver)
+        if self._session.logged_in_as:
+            self._sign_out()
+        self._vault_stale = False  # every path below loads (and syncs) the vault
+
+        if not fresh and snapshots_enabled():
+            snap = SNAPSHOTS.get(self.base_url, email)
+            if snap:
+                if restore_state(self.driver, self.base_url, snap):
+                    self._session.logged_in_as = email
+                    return DashboardPage(self.driver)
+                # stale/expired snapshot: forget it and log in for real
+                SNAPSHOTS.drop(self.base_url, email)
+                self._sign_out()
+
+        dashboard = (
+            LoginPage(self.driver)
+            .enter_email(email)
+            .click_continue()
+            .enter_password(password)
+            .click_login()
+        )
+        self._session.logged_in_as = email
+        if snapshots_enabled():
+            try:
+                SNAPSHOTS.put(self.base_url, email, capture_state(self.driver))
+            except WebDriverException:
+                pass
+        return dashboard
+
+    def _reload_vault(self) -> bool:
+        """Reload the web vault so it syncs API-created items. False if it lands signed out."""
+        self.driver.refresh()
         try:
-            cur = self.driver.current_url
-            host = urlparse(cur).netloc
-            if "ngrok-free.app" in host:
-                # Try query param trick (some edges honor it)
-                if "ngrok-skip-browser-warning" not in cur:
-                    u = urlparse(cur)
-                    q = dict(parse_qsl(u.query))
-                    q["ngrok-skip-browser-warning"] = "true"
-                    self.driver.get(urlunparse(u._replace(query=urlencode(q))))
-                # If still showing splash, click "Visit Site"
-                if (
-                    "Visit Site" in self.driver.page_source
-                    or "ngrok" in (self.driver.title or "").lower()
-                ):
-                    btn = self.wait.until(
-                        EC.element_to_be_clickable(
-                            (
-                                By.XPATH,
-                                "//*[self::a or self::button][normalize-space()='Visit Site']",
-                            )
-                        )
-                    )
-                    btn.click()
-        except Exception:
-            # Don’t block tests if bypass fails
-            pass
+            WebDriverWait(self.driver, 20).until(
+                EC.presence_of_element_located((By.XPATH, _VAULT_OR_LOGIN))
+            )
+        except TimeoutException:
+            return False
+        url = self.driver.current_url
+        return "#/login" not in url and "#/lock" not in url
+
+    # ---------------- preconditions ----------------
+    def given_login_item(
+        self, email, password, name, username, secret, uri="https://example.com", trashed=False
+    ) -> bool:
+        """
+        Precondition: a Login item `name` owned by `email` (in the Trash when
+        trashed=True). Created through the API, with fields encrypted client-side,
+        and purged after the test when the API key belongs to this user; otherwise
+        created (and trashed) through the UI. Returns True when API-managed.
+        """
+        data = api_vault_data(self.base_url, email, password) if api_preconditions() else None
+        if data is not None and data.available:
+            cipher_id = data.create_login(name, username, secret, uri)
+            self.addCleanup(data.purge, cipher_id)
+            if trashed:
+                data.move_to_trash(cipher_id)
+            self._vault_stale = True
+            return True
+
+        (
+            self.login(email, password)
+            .click_new_button()
+            .select_menu_item("Login")
+            .enter_item_name(name)
+            .enter_item_username(username)
+            .enter_item_password(secret)
+            .enter_website(uri)
+            .save_item()
+            .assert_toast_message(any_of=["Item added", "Item saved", "Item created"], timeout=10)
+            .close_popup()
+        )
+        if trashed:
+            (
+                DashboardPage(self.driver)
+                .open_item_options_for(name)
+                .click_delete()
+                .confirm_delete()
+                .assert_toast_message(any_of=["Item sent to trash"], timeout=10)
+            )
+        return False
+
+    def _bypass_ngrok_splash(self):
+        bypass_ngrok_splash(self.driver)
 
     def debug_dump(self, name: str = "login_timeout"):
         try:
@@ -0,0 +1,117 @@
+# tests/ui/chromedriver.py
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+from tests.common.envtools import env_flag
+
+_CHROME_BINARIES = [
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+]
+
+_resolved = {}
+_version = []  # [detected version or None], filled once per process
+_lock = threading.Lock()
+
+
+def offline_mode() -> bool:
+    """VW_DRIVER_OFFLINE=1: never touch the network to resolve a driver."""
+    return env_flag("VW_DRIVER_OFFLINE")
+
+
+def chrome_version():
+    """Installed Chrome version (e.g. '126.0.6478.126'), or None if not found."""
+    candidates = [os.getenv("CHROME_BIN")] + _CHROME_BINARIES
+    for binary in [c for c in candidates if c]:
+        exe = binary if os.path.isabs(binary) else shutil.which(binary)
+        if not exe or not os.path.exists(exe):
+            continue
+        try:
+            out = subprocess.run(
+                [exe, "--version"], capture_output=True, text=True, timeout=10
+            ).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        m = re.search(r"(\d+\.\d+\.\d+\.\d+)", out or "")
+        if m:
+            return m.group(1)
+    return None
+
+
+def _cache_path() -> str:
+    return os.getenv("VW_DRIVER_CACHE") or os.path.join(
+        tempfile.gettempdir(), "vw_chromedriver_cache.json"
+    )
+
+
+def _read_cache() -> dict:
+    try:
+        with open(_cache_path(), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_cache(data: dict):
+    path = _cache_path()
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)  # parallel workers never see a half-written file
+    except OSError:
+        pass
+
+
+def resolve_driver_path():
+    """
+    Path to a chromedriver matching the installed Chrome, resolved once per
+    session and cached on disk per Chrome version so later runs skip the
+    network. Returns None in offline mode when nothing is pinned/cached, which
+    lets Selenium Manager use its local cache (SE_OFFLINE).
+    """
+    pinned = os.getenv("CHROMEDRIVER_PATH")
+    if pinned:
+        return pinned
+
+    with _lock:
+        if not _version:
+            _version.append(chrome_version())  # one `chrome --version` per process
+        version = _version[0] or "unknown"
+        if version in _resolved:
+            return _resolved[version]
+
+        # an undetected Chrome may be any version: only remember it in-process
+        cache = _read_cache() if _version[0] else {}
+        path = cache.get(version)
+        if not (path and os.path.exists(path)):
+            path = None
+            if not offline_mode():
+                path = ChromeDriverManager().install()
+                if _version[0]:
+                    cache[version] = path
+                    _write_cache(cache)
+
+        _resolved[version] = path
+        return path
+
+
+def chrome_service() -> Service:
+    """Chrome Service using the cached driver (or Selenium Manager offline)."""
+    path = resolve_driver_path()
+    if path:
+        return Service(path)
+    # Selenium Manager honours SE_OFFLINE and only uses drivers it has cached
+    os.environ.setdefault("SE_OFFLINE", "true")
+    return Service()
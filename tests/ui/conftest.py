@@ -0,0 +1,23 @@
+# tests/ui/conftest.py
+from tests.ui.auth_state import close_snapshot_dir, open_snapshot_dir
+from tests.ui.base_ui import prewarm_launch
+from tests.ui.driver_pool import POOL, prewarm_count
+
+
+def pytest_configure(config):
+    # signed-in browser state lives only as long as this run (xdist workers inherit it)
+    config._vw_auth_dir = open_snapshot_dir()
+
+
+def pytest_unconfigure(config):
+    if getattr(config, "_vw_auth_dir", None):
+        close_snapshot_dir(config._vw_auth_dir)
+
+
+def pytest_collection_finish(session):
+    """Start booting browsers as soon as this worker knows it will run UI tests."""
+    if session.config.option.collectonly:
+        return
+    if not any("tests/ui/" in item.nodeid for item in session.items):
+        return
+    POOL.prewarm(prewarm_launch, prewarm_count())
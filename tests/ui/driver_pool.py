@@ -0,0 +1,160 @@
+# tests/ui/driver_pool.py
+import atexit
+import json
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from selenium.common.exceptions import WebDriverException
+
+from tests.common.envtools import worker_id
+
+
+def prewarm_count() -> int:
+    """VW_PREWARM: browsers to keep launching in the background (default 1, 0 disables)."""
+    try:
+        return max(int(os.getenv("VW_PREWARM", "1")), 0)
+    except ValueError:
+        return 1
+
+
+@contextmanager
+def phase(timings: dict, name: str):
+    """Record the block's wall time (seconds) as startup phase `name`."""
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = round(time.perf_counter() - t0, 3)
+
+
+class DriverSession:
+    """A live Chrome plus the bits of state we track across tests."""
+
+    def __init__(self, driver, profile_dir):
+        self.driver = driver
+        self.profile_dir = profile_dir
+        self.logged_in_as = None  # email of the account the browser is signed into
+        self.warmed = False  # launched ahead of time and already parked on the login page
+        self.startup = {}  # startup phase -> seconds (driver_resolve, process_launch, ...)
+
+    def alive(self) -> bool:
+        try:
+            _ = self.driver.current_url  # any command round-trip will do
+            return True
+        except WebDriverException:
+            return False
+
+    def quit(self):
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+        finally:
+            shutil.rmtree(self.profile_dir, ignore_errors=True)
+
+
+class DriverPool:
+    """
+    Keeps browsers alive between tests in this process (one pool per xdist worker).
+    Sessions that crashed are dropped and relaunched on the next acquire().
+
+    prewarm() launches browsers on background threads while earlier tests run;
+    acquire() hands those out before launching synchronously. (WebDriver
+    sessions belong to the process that started chromedriver, so threads rather
+    than a process pool; the launch is subprocess/IO-bound anyway.)
+    """
+
+    def __init__(self):
+        self._idle = []
+        self._warming = []  # futures resolving to DriverSession
+        self._executor = None
+        self._lock = threading.Lock()
+        self.profiles = []  # startup timings of every session handed out
+
+    def prewarm(self, launch, count=1):
+        """Start `launch()` in the background until `count` sessions are idle or warming."""
+        with self._lock:
+            missing = count - len(self._idle) - len(self._warming)
+            if missing <= 0:
+                return
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max(count, 1), thread_name_prefix="vw-prewarm"
+                )
+            for _ in range(missing):
+                self._warming.append(self._executor.submit(launch))
+
+    def acquire(self, launch) -> DriverSession:
+        """Return an idle live session, else a pre-warmed one, else `launch()` a new one."""
+        while True:
+            with self._lock:
+                session = self._idle.pop() if self._idle else None
+                pending = self._warming.pop(0) if session is None and self._warming else None
+            if pending is not None:
+                t0 = time.perf_counter()
+                try:
+                    session = pending.result()
+                except Exception:
+                    continue  # a failed background launch: try the next one or launch here
+                session.startup["acquire_wait"] = round(time.perf_counter() - t0, 3)
+            if session is None:
+                return self._handed_out(launch())
+            if session.alive():
+                return self._handed_out(session)
+            session.quit()
+
+    def _handed_out(self, session: DriverSession) -> DriverSession:
+        if session.startup and "warmed" not in session.startup:
+            # same dict, so phases recorded later (first navigation) still land in it
+            session.startup["warmed"] = session.warmed
+            self.profiles.append(session.startup)
+        return session
+
+    def release(self, session: DriverSession):
+        with self._lock:
+            self._idle.append(session)
+
+    def write_profile(self, path=None):
+        """Dump per-session startup phases plus mean/max per phase as JSON."""
+        if not self.profiles:
+            return
+        phases = {}
+        for p in self.profiles:
+            for k, v in p.items():
+                if isinstance(v, (int, float)) and not isinstance(v, bool):
+                    phases.setdefault(k, []).append(v)
+        summary = {
+            k: {"mean": round(sum(v) / len(v), 3), "max": max(v), "n": len(v)}
+            for k, v in phases.items()
+        }
+        path = path or os.path.join("reports", f"browser-startup-{worker_id()}.json")
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"sessions": self.profiles, "summary": summary}, f, indent=2)
+        except OSError:
+            pass
+
+    def shutdown(self):
+        with self._lock:
+            sessions, self._idle = self._idle, []
+            warming, self._warming = self._warming, []
+            executor, self._executor = self._executor, None
+        for f in warming:
+            try:
+                sessions.append(f.result(timeout=120))
+            except Exception:
+                pass
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        for s in sessions:
+            s.quit()
+        self.write_profile()
+
+
+POOL = DriverPool()
+atexit.register(POOL.shutdown)
@@ -0,0 +1,182 @@
+# tests/ui/locators.py
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+
+from selenium.webdriver.common.by import By
+
+try:  # POSIX only; elsewhere writes are serialized per process only
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+# Poll every strategy each animation frame; resolve with the first one (in the
+# given order) that matches, so a working fallback wins without waiting out
+# the timeout of the ones before it.
+_RACE_JS = r"""
+const [strategies, needVisible, needText, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+const vis = (el) => {
+  const r = el.getBoundingClientRect();
+  const cs = window.getComputedStyle(el);
+  return r.width > 0 && r.height > 0 && cs.visibility !== 'hidden' && cs.display !== 'none';
+};
+const query = ([kind, sel]) => {
+  try {
+    if (kind === 'css') return Array.from(document.querySelectorAll(sel));
+    const snap = document.evaluate(sel, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const found = [];
+    for (let i = 0; i < snap.snapshotLength; i++) found.push(snap.snapshotItem(i));
+    return found;
+  } catch (e) { return []; }
+};
+const ok = (el) => (!needVisible || vis(el)) && (!needText || ((el.innerText || '') + '').trim());
+const deadline = Date.now() + timeoutMs;
+const tick = () => {
+  for (let i = 0; i < strategies.length; i++) {
+    const el = query(strategies[i]).find(ok);
+    if (el) return done({ index: i, el: el });
+  }
+  if (Date.now() >= deadline) return done(null);
+  requestAnimationFrame(() => setTimeout(tick, 25));
+};
+tick();
+"""
+
+_VERSION_JS = r"""
+const done = arguments[arguments.length - 1];
+fetch('version.json', { cache: 'force-cache' })
+  .then((r) => (r.ok ? r.json() : {}))
+  .then((j) => done(j.version || 'unknown'), () => done('unknown'));
+"""
+
+
+def strategy_key(by, value) -> str:
+    return f"{by}={value}"
+
+
+def to_js(by, value):
+    """(By.*, selector) -> ["css"|"xpath", selector] for _RACE_JS."""
+    if by == By.CSS_SELECTOR:
+        return ["css", value]
+    if by == By.XPATH:
+        return ["xpath", value]
+    if by == By.ID:
+        return ["css", f'[id="{value}"]']
+    if by == By.NAME:
+        return ["css", f'[name="{value}"]']
+    if by == By.CLASS_NAME:
+        return ["css", f".{value}"]
+    raise ValueError(f"Unsupported locator strategy for racing: {by}")
+
+
+class LocatorRegistry:
+    """
+    Remembers which fallback strategy located each logical element, per
+    web-vault version, in memory and in a temp JSON file (VW_LOCATOR_CACHE
+    overrides the path) shared by workers and later runs.
+    """
+
+    def __init__(self, path=None):
+        self.path = (
+            path
+            or os.getenv("VW_LOCATOR_CACHE")
+            or os.path.join(tempfile.gettempdir(), "vw_locator_cache.json")
+        )
+        self._data = None
+        self._lock = threading.Lock()
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _load(self) -> dict:
+        if self._data is None:
+            self._data = self._read()
+        return self._data
+
+    @contextmanager
+    def _file_lock(self):
+        if fcntl is None:
+            yield
+            return
+        with open(f"{self.path}.lock", "a") as lf:
+            fcntl.flock(lf, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lf, fcntl.LOCK_UN)
+
+    def order(self, version, name, strategies) -> list:
+        """`strategies` with the last known-good one first."""
+        with self._lock:
+            known = self._load().get(version, {}).get(name)
+        if not known:
+            return list(strategies)
+        first = [s for s in strategies if strategy_key(*s) == known]
+        return first + [s for s in strategies if strategy_key(*s) != known]
+
+    def record(self, version, name, strategy):
+        key = strategy_key(*strategy)
+        with self._lock:
+            if self._load().get(version, {}).get(name) == key:
+                return
+            tmp = f"{self.path}.{os.getpid()}.tmp"
+            try:
+                with self._file_lock():
+                    # merge into what other workers wrote meanwhile, then add ours
+                    data = self._read()
+                    for ver, names in self._data.items():
+                        data.setdefault(ver, {}).update(
+                            {n: v for n, v in names.items() if n not in data[ver]}
+                        )
+                    data.setdefault(version, {})[name] = key
+                    with open(tmp, "w", encoding="utf-8") as f:
+                        json.dump(data, f, indent=2, sort_keys=True)
+                    os.replace(tmp, self.path)
+            except OSError:
+                data = self._data
+                data.setdefault(version, {})[name] = key
+            self._data = data
+
+
+LOCATORS = LocatorRegistry()
+
+
+def race(driver, strategies, visible=True, text=False, timeout=10):
+    """(index, element) of the first matching (By, selector) in `strategies`, or None."""
+    driver.set_script_timeout(timeout + 5)
+    hit = driver.execute_async_script(
+        _RACE_JS, [to_js(*s) for s in strategies], visible, text, int(timeout * 1000)
+    )
+    return (hit["index"], hit["el"]) if hit else None
+
+
+_versions = {}
+_versions_lock = threading.Lock()
+
+
+def web_vault_version(driver) -> str:
+    """Web-vault build serving the current page (from its version.json), memoized per origin."""
+    try:
+        origin = driver.execute_script("return location.origin;")
+    except Exception:
+        return "unknown"
+    with _versions_lock:
+        if origin in _versions:
+            return _versions[origin]
+    try:
+        driver.set_script_timeout(10)
+        version = driver.execute_async_script(_VERSION_JS) or "unknown"
+    except Exception:
+        version = "unknown"
+    if version != "unknown":  # app not loaded yet: ask again next time
+        with _versions_lock:
+            _versions[origin] = version
+    return version
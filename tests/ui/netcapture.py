@@ -0,0 +1,320 @@
+# tests/ui/netcapture.py
+import json
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+try:
+    import allure
+except ImportError:  # pragma: no cover - allure-pytest is optional locally
+    allure = None
+
+from tests.common.envtools import env_flag
+
+_TIMING_MARK_JS = "return [performance.timeOrigin, performance.now()];"
+
+_TIMING_SINCE_JS = r"""
+const [origin, since] = arguments;
+const fresh = performance.timeOrigin !== origin;  // a full navigation happened
+const from = fresh ? 0 : since;
+const pick = (e) => ({
+  name: e.name, type: e.initiatorType || e.entryType, start_ms: e.startTime,
+  duration_ms: e.duration, ttfb_ms: e.responseStart ? e.responseStart - e.requestStart : null,
+  transfer_bytes: e.transferSize || 0,
+});
+const nav = performance.getEntriesByType('navigation')[0];
+return {
+  navigation: fresh && nav ? Object.assign(pick(nav), {
+    dom_content_loaded_ms: nav.domContentLoadedEventEnd, load_ms: nav.loadEventEnd,
+  }) : null,
+  resources: performance.getEntriesByType('resource').filter((e) => e.startTime >= from).map(pick),
+};
+"""
+
+
+# Reports and Allure results get published (ui-manual uploads them to Pages):
+# credentials never leave the recorder.
+REDACTED = "[redacted]"
+_SENSITIVE_HEADERS = {"authorization", "proxy-authorization", "cookie", "set-cookie"}
+_SENSITIVE_PARAMS = {"access_token", "refresh_token", "token", "code", "client_secret"}
+_BEARER_RE = re.compile(r"Bearer\s+(?!\[redacted\])[A-Za-z0-9._~+/=-]{8,}", re.IGNORECASE)
+
+
+def _is_sensitive_header(name: str) -> bool:
+    name = name.lower()
+    return name in _SENSITIVE_HEADERS or "token" in name or "secret" in name
+
+
+def redact_headers(headers: dict) -> dict:
+    return {k: (REDACTED if _is_sensitive_header(k) else v) for k, v in headers.items()}
+
+
+def redact_url(url: str) -> str:
+    """`url` with token-like query parameters (e.g. the notifications hub's access_token) blanked."""
+    parts = urlsplit(url)
+    if not parts.query:
+        return url
+    query = [
+        (k, REDACTED if k.lower() in _SENSITIVE_PARAMS else v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+    ]
+    return urlunsplit(parts._replace(query=urlencode(query, safe="[]")))
+
+
+def capture_enabled() -> bool:
+    """VW_NET_CAPTURE=1: record CDP network events + per-step timings in UI tests."""
+    return env_flag("VW_NET_CAPTURE")
+
+
+def enable_capture(opts):
+    """Turn on Chrome's performance log (CDP Network.* events) for these options."""
+    opts.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+
+class NetworkRecorder:
+    """
+    Collects CDP Network events from Chrome's performance log and groups them
+    into named steps (one per page-object action), with Resource/Navigation
+    Timing for each step. Produces a HAR and a per-step latency breakdown.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.requests = {}  # requestId -> record
+        self.steps = []
+        self._lock = threading.RLock()  # actions may call other recorded actions
+
+    # ---------------- CDP log ----------------
+    def drain(self):
+        try:
+            entries = self.driver.get_log("performance")
+        except Exception:
+            return
+        for entry in entries:
+            try:
+                msg = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError):
+                continue
+            self._on_event(msg.get("method", ""), msg.get("params", {}))
+
+    def _on_event(self, method, p):
+        rid = p.get("requestId")
+        if not rid or not method.startswith("Network."):
+            return
+        rec = self.requests.get(rid)
+        if method == "Network.requestWillBeSent":
+            req = p.get("request", {})
+            self.requests[rid] = {
+                "url": redact_url(req.get("url", "")),
+                "method": req.get("method", "GET"),
+                "request_headers": redact_headers(req.get("headers", {})),
+                "wall_start": p.get("wallTime"),
+                "ts_start": p.get("timestamp"),
+                "status": None,
+                "mime": None,
+                "timing": None,
+                "ts_end": None,
+                "bytes": 0,
+                "error": None,
+            }
+        elif rec is None:
+            return
+        elif method == "Network.responseReceived":
+            resp = p.get("response", {})
+            rec.update(
+                status=resp.get("status"),
+                mime=resp.get("mimeType"),
+                timing=resp.get("timing"),
+                protocol=resp.get("protocol"),
+                response_headers=redact_headers(resp.get("headers", {})),
+            )
+        elif method == "Network.loadingFinished":
+            rec.update(ts_end=p.get("timestamp"), bytes=p.get("encodedDataLength", 0))
+        elif method == "Network.loadingFailed":
+            rec.update(ts_end=p.get("timestamp"), error=p.get("errorText"))
+
+    # ---------------- steps ----------------
+    @contextmanager
+    def step(self, name):
+        with self._lock:
+            self.drain()  # everything before this step belongs elsewhere
+            try:
+                mark = self.driver.execute_script(_TIMING_MARK_JS)
+            except Exception:
+                mark = None
+            wall0, t0 = time.time(), time.perf_counter()
+            try:
+                yield
+            finally:
+                duration = time.perf_counter() - t0
+                wall1 = time.time()
+                self.drain()
+                timing = None
+                if mark:
+                    try:
+                        timing = self.driver.execute_script(_TIMING_SINCE_JS, *mark)
+                    except Exception:
+                        pass
+                self.steps.append(self._summarize(name, wall0, wall1, duration, timing))
+
+    def _summarize(self, name, wall0, wall1, duration, timing):
+        reqs = [
+            r
+            for r in self.requests.values()
+            if r["wall_start"] and wall0 <= r["wall_start"] <= wall1
+        ]
+        intervals, server_wait = [], 0.0
+        for r in reqs:
+            dur = (r["ts_end"] - r["ts_start"]) if r["ts_end"] and r["ts_start"] else 0.0
+            intervals.append((r["wall_start"], min(r["wall_start"] + dur, wall1)))
+            t = r.get("timing") or {}
+            if t.get("receiveHeadersEnd") is not None and t.get("sendEnd") is not None:
+                server_wait += max(t["receiveHeadersEnd"] - t["sendEnd"], 0.0)
+        busy = _union_seconds(intervals)
+        slowest = sorted(
+            reqs, key=lambda r: (r["ts_end"] or 0) - (r["ts_start"] or 0), reverse=True
+        )
+        return {
+            "step": name,
+            "duration_ms": round(duration * 1000, 1),
+            "requests": len(reqs),
+            "bytes": int(sum(r["bytes"] or 0 for r in reqs)),
+            "network_busy_ms": round(busy * 1000, 1),
+            "server_wait_ms": round(server_wait, 1),
+            "client_ms": round(max(duration - busy, 0.0) * 1000, 1),
+            "errors": [r["url"] for r in reqs if r["error"] or (r["status"] or 0) >= 400],
+            "slowest": [
+                {
+                    "url": r["url"],
+                    "status": r["status"],
+                    "ms": round(((r["ts_end"] or r["ts_start"]) - r["ts_start"]) * 1000, 1),
+                }
+                for r in slowest[:5]
+                if r["ts_start"]
+            ],
+            "page_timing": timing,
+        }
+
+    def reset(self):
+        self.drain()
+        self.requests.clear()
+        self.steps.clear()
+
+    # ---------------- export ----------------
+    def to_har(self) -> dict:
+        entries = []
+        for r in sorted(self.requests.values(), key=lambda r: r["wall_start"] or 0):
+            t = r.get("timing") or {}
+            total = ((r["ts_end"] - r["ts_start"]) * 1000) if r["ts_end"] and r["ts_start"] else -1
+            wait = (
+                t["receiveHeadersEnd"] - t["sendEnd"]
+                if "receiveHeadersEnd" in t and "sendEnd" in t
+                else -1
+            )
+            entries.append(
+                {
+                    "startedDateTime": _iso(r["wall_start"]),
+                    "time": round(total, 3),
+                    "request": {
+                        "method": r["method"],
+                        "url": r["url"],
+                        "httpVersion": r.get("protocol") or "",
+                        "headers": _har_headers(r["request_headers"]),
+                        "queryString": [],
+                        "cookies": [],
+                        "headersSize": -1,
+                        "bodySize": -1,
+                    },
+                    "response": {
+                        "status": r["status"] or 0,
+                        "statusText": r["error"] or "",
+                        "httpVersion": r.get("protocol") or "",
+                        "headers": _har_headers(r.get("response_headers") or {}),
+                        "cookies": [],
+                        "content": {"size": r["bytes"] or 0, "mimeType": r["mime"] or ""},
+                        "redirectURL": "",
+                        "headersSize": -1,
+                        "bodySize": r["bytes"] or 0,
+                    },
+                    "cache": {},
+                    "timings": {"send": 0, "wait": round(wait, 3), "receive": 0},
+                }
+            )
+        return {
+            "log": {
+                "version": "1.2",
+                "creator": {"name": "vw-ui-tests", "version": "1.0"},
+                "entries": entries,
+            }
+        }
+
+    def attach(self, name: str):
+        """Attach HAR + step breakdown to Allure and write copies under reports/."""
+        self.drain()
+        har = json.dumps(self.to_har(), indent=2)
+        steps = json.dumps(self.steps, indent=2)
+        if _BEARER_RE.search(har) or _BEARER_RE.search(steps):
+            # belt and braces: something slipped past redaction, publish nothing
+            har = steps = json.dumps({"error": "capture withheld: unredacted bearer token"})
+        try:
+            os.makedirs("reports", exist_ok=True)
+            with open(f"reports/{name}.har", "w", encoding="utf-8") as f:
+                f.write(har)
+            with open(f"reports/{name}.steps.json", "w", encoding="utf-8") as f:
+                f.write(steps)
+        except OSError:
+            pass
+        if allure is not None:
+            allure.attach(har, name=f"{name}.har", attachment_type=allure.attachment_type.JSON)
+            allure.attach(
+                steps, name=f"{name} step timings", attachment_type=allure.attachment_type.JSON
+            )
+
+
+def _union_seconds(intervals) -> float:
+    total, cur_start, cur_end = 0.0, None, None
+    for start, end in sorted(intervals):
+        if cur_end is None or start > cur_end:
+            if cur_end is not None:
+                total += cur_end - cur_start
+            cur_start, cur_end = start, end
+        else:
+            cur_end = max(cur_end, end)
+    if cur_end is not None:
+        total += cur_end - cur_start
+    return total
+
+
+def _iso(wall):
+    if not wall:
+        return ""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(wall)) + f".{int(wall % 1 * 1000):03d}Z"
+
+
+def _har_headers(headers: dict) -> list:
+    return [{"name": k, "value": str(v)} for k, v in redact_headers(headers).items()]
+
+
+_recorders = {}
+_recorders_lock = threading.Lock()
+
+
+def attach_recorder(driver) -> NetworkRecorder:
+    with _recorders_lock:
+        rec = _recorders.get(id(driver))
+        if rec is None:
+            rec = _recorders[id(driver)] = NetworkRecorder(driver)
+        return rec
+
+
+def recorder_for(driver):
+    """The recorder attached to this driver, or None when capture is off."""
+    return _recorders.get(id(driver))
+
+
+def detach_recorder(driver):
+    with _recorders_lock:
+        _recorders.pop(id(driver), None)
@@ -3,22 +3,259 @@ from selenium.common.exceptions import (
     ElementClickInterceptedException,
     StaleElementReferenceException,
     TimeoutException,
+    WebDriverException,
 )
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
+
+from tests.ui.locators import LOCATORS, race, web_vault_version
+from tests.ui.tracing import TRACER, TimedWait, instrument_actions
+
+# Installed once per document: a MutationObserver records every toast-ish node
+# that becomes visible with text into window.__vwToasts, so toasts are caught
+# even if they vanish before we look.
+_TOAST_WATCHER_JS = r"""
+if (window.__vwToastWatch) return true;
+const SEL = ".ngx-toastr, .toast, [class*='toast'], [class*='notification'], [class*='alert']";
+const buf = (window.__vwToasts = []);
+const listeners = (window.__vwToastListeners = []);
+const seen = new WeakSet();
+const textOf = (el) => {
+  const msgs = el.querySelectorAll('.toast-message, .message');
+  const src = msgs.length ? msgs[msgs.length - 1] : el;
+  return ((src.innerText || src.textContent || '') + '').trim();
+};
+const consider = (el) => {
+  if (!el || seen.has(el) || !el.isConnected || !el.getClientRects().length) return;
+  const text = textOf(el);
+  if (!text) return;  // text may still arrive; a later mutation re-checks it
+  seen.add(el);
+  const entry = { text: text, el: el, used: false };
+  buf.push(entry);
+  listeners.slice().forEach((fn) => fn(entry));
+};
+const scan = (node) => {
+  const el = node && node.nodeType === 1 ? node : node && node.parentElement;
+  if (!el) return;
+  if (el.matches(SEL)) consider(el);
+  el.querySelectorAll(SEL).forEach(consider);
+  const host = el.parentElement && el.parentElement.closest(SEL);
+  if (host) consider(host);
+};
+new MutationObserver((muts) => {
+  for (const m of muts) {
+    if (m.type === 'childList') m.addedNodes.forEach(scan);
+    scan(m.target);
+  }
+}).observe(document.documentElement, { childList: true, subtree: true, characterData: true });
+document.querySelectorAll(SEL).forEach(consider);
+window.__vwToastWatch = true;
+return true;
+"""
+
+# Resolves with the newest unconsumed toast matching any wanted text (or any
+# toast if none wanted), or {text: null, last} after the timeout.
+_TOAST_AWAIT_JS = r"""
+const wanted = arguments[0].map((w) => w.toLowerCase());
+const timeoutMs = arguments[1];
+const done = arguments[arguments.length - 1];
+const buf = window.__vwToasts || [];
+const listeners = window.__vwToastListeners || [];
+let timer = null, listener = null, finished = false;
+const ok = (e) => !e.used && (!wanted.length || wanted.some((w) => e.text.toLowerCase().includes(w)));
+const finish = (e) => {
+  if (finished) return;
+  finished = true;
+  clearTimeout(timer);
+  const i = listeners.indexOf(listener);
+  if (i >= 0) listeners.splice(i, 1);
+  if (e) {
+    e.used = true;
+    done({ text: e.text, el: e.el.isConnected ? e.el : null });
+  } else {
+    const open = buf.filter((x) => !x.used);
+    done({ text: null, last: open.length ? open[open.length - 1].text : '' });
+  }
+};
+const hit = buf.slice().reverse().find(ok);
+if (hit) {
+  finish(hit);
+} else {
+  listener = (e) => { if (ok(e)) finish(e); };
+  listeners.push(listener);
+  timer = setTimeout(() => finish(null), timeoutMs);
+}
+"""
+
+
+# One round trip for "find elements + visibility + text + geometry".
+_QUERY_NODES_JS = r"""
+const [sels, within, textSel, visibleOnly, isXpath] = arguments;
+const vis = (el) => {
+  const r = el.getBoundingClientRect();
+  const cs = window.getComputedStyle(el);
+  return r.width > 0 && r.height > 0 && cs.visibility !== 'hidden' && cs.display !== 'none';
+};
+const findAll = (root, sel) => {
+  if (!isXpath) return Array.from(root.querySelectorAll(sel));
+  const snap = document.evaluate(sel, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+  const found = [];
+  for (let i = 0; i < snap.snapshotLength; i++) found.push(snap.snapshotItem(i));
+  return found;
+};
+let roots = [document];
+if (within && within.length) {
+  const found = [...new Set(within.flatMap((w) => Array.from(document.querySelectorAll(w))))];
+  roots = found.length ? found.filter(vis) : [document.body];
+}
+const out = [];
+for (const root of roots) {
+  for (const sel of sels) {
+    for (const el of findAll(root, sel)) {
+      const visible = vis(el);
+      if (visibleOnly && !visible) continue;
+      let text = '';
+      if (textSel) {
+        const m = el.querySelectorAll(textSel);
+        if (m.length) text = ((m[m.length - 1].innerText || '') + '').trim();
+      }
+      if (!text) text = ((el.innerText || el.textContent || '') + '').trim();
+      const r = el.getBoundingClientRect();
+      out.push({ el: el, visible: visible, text: text,
+                 rect: { x: r.x, y: r.y, width: r.width, height: r.height } });
+    }
+  }
+}
+return out;
+"""
+
+
+# Idle detection: Angular testabilities (when the build exposes them), in-flight
+# XHR/fetch counted by patching both once per document, and DOM quiet time.
+# The hooks go in on page load (new-document script + BasePage.__init__) so
+# requests started by the first click are already counted.
+_IDLE_HOOKS_JS = r"""
+if (!window.__vwIdle) {
+  const st = (window.__vwIdle = { pending: 0, lastMutation: Date.now() });
+  const origSend = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function () {
+    st.pending++;
+    let settled = false;
+    const fin = () => { if (!settled) { settled = true; st.pending--; } };
+    this.addEventListener('loadend', fin);
+    try { return origSend.apply(this, arguments); } catch (e) { fin(); throw e; }
+  };
+  const origFetch = window.fetch;
+  if (origFetch) {
+    window.fetch = function () {
+      st.pending++;
+      let p;
+      try { p = origFetch.apply(this, arguments); } catch (e) { st.pending--; throw e; }
+      return p.finally(() => { st.pending--; });
+    };
+  }
+  // `document`, not documentElement: it exists before <html> is parsed
+  new MutationObserver(() => { st.lastMutation = Date.now(); })
+    .observe(document, { childList: true, subtree: true, characterData: true });
+}
+"""
+
+_IDLE_AWAIT_JS = (
+    _IDLE_HOOKS_JS
+    + r"""
+const [timeoutMs, quietMs, minWaitMs] = arguments;
+const done = arguments[arguments.length - 1];
+const st = window.__vwIdle;
+const start = Date.now();
+const ngStable = () => new Promise((resolve) => {
+  const get = window.getAllAngularTestabilities;
+  const ts = get ? get() : [];
+  if (!ts.length) return resolve(true);
+  let left = ts.length;
+  const one = () => { if (--left === 0) resolve(true); };
+  ts.forEach((t) => { try { t.whenStable(one); } catch (e) { one(); } });
+});
+const tick = () => {
+  const now = Date.now();
+  if (now - start >= timeoutMs) return done(false);
+  if (now - start >= minWaitMs && st.pending <= 0 && now - st.lastMutation >= quietMs) {
+    return done(true);
+  }
+  setTimeout(tick, 25);
+};
+Promise.race([ngStable(), new Promise((r) => setTimeout(() => r(false), timeoutMs))])
+  .then((ok) => (ok ? tick() : done(false)));
+"""
+)
+
+# What BasePage.__init__ installs, in one round trip; `__vwHooks` short-circuits
+# it when this document already has both.
+_PAGE_HOOKS_JS = (
+    "if (window.__vwHooks) return true;\n"
+    + _IDLE_HOOKS_JS
+    + "(() => {\n"
+    + _TOAST_WATCHER_JS
+    + "})();\nwindow.__vwHooks = true;\nreturn true;\n"
+)
+
+
+def install_idle_hooks(driver) -> bool:
+    """
+    Count XHR/fetch from the very start of every document this browser loads
+    (CDP new-document script) and in the current one. Once per browser session.
+    """
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": _IDLE_HOOKS_JS})
+    except WebDriverException:
+        pass  # not Chromium: BasePage still installs them per page object
+    try:
+        driver.execute_script(_IDLE_HOOKS_JS)
+        return True
+    except WebDriverException:
+        return False
 
 
 #
 class BasePage:
+    def __init_subclass__(cls, **kwargs):
+        # every public page action gets timing/tracing hooks (see tests/ui/tracing.py)
+        super().__init_subclass__(**kwargs)
+        instrument_actions(cls)
+
     def __init__(self, driver):
         self.driver = driver
-        self.wait = WebDriverWait(driver, 30)
+        self.wait = TimedWait(driver, 30)
+        self._install_page_hooks()
+
+    # ---------------- app stability ----------------
+    def _install_page_hooks(self):
+        """Idle hooks + toast watcher in one call; a cheap no-op once the document has them."""
+        try:
+            self.driver.execute_script(_PAGE_HOOKS_JS)
+            return True
+        except Exception:
+            return False
+
+    def wait_for_app_idle(self, timeout=5.0, quiet_ms=100, min_wait_ms=0) -> bool:
+        """
+        Block until the web vault has settled: Angular stable (when testabilities
+        are exposed), no XHR/fetch in flight and no DOM mutations for `quiet_ms`.
+        Returns False on timeout; callers' own explicit waits still apply.
+        """
+        try:
+            self.driver.set_script_timeout(timeout + 5)
+            return bool(
+                self.driver.execute_async_script(
+                    _IDLE_AWAIT_JS, int(timeout * 1000), quiet_ms, min_wait_ms
+                )
+            )
+        except WebDriverException:
+            return False
 
     # ---------------- overlays / dialogs ----------------
     def _wait_for_no_overlay(self, timeout=10):
         try:
-            WebDriverWait(self.driver, timeout).until(
+            TimedWait(self.driver, timeout).until(
                 EC.invisibility_of_element_located(
                     (By.CSS_SELECTOR, ".cdk-overlay-backdrop.cdk-overlay-backdrop-showing")
                 )
@@ -35,7 +272,7 @@ class BasePage:
         ]
         for sel in close_selectors:
             try:
-                btn = WebDriverWait(self.driver, 2).until(
+                btn = TimedWait(self.driver, 2).until(
                     EC.element_to_be_clickable((By.CSS_SELECTOR, sel))
                 )
                 try:
@@ -47,7 +284,7 @@ class BasePage:
                 continue
 
         try:
-            backdrop = WebDriverWait(self.driver, 1).until(
+            backdrop = TimedWait(self.driver, 1).until(
                 EC.visibility_of_element_located(
                     (By.CSS_SELECTOR, ".cdk-overlay-backdrop.cdk-overlay-backdrop-showing")
                 )
@@ -66,7 +303,7 @@ class BasePage:
 
         self._wait_for_no_overlay(timeout)
         try:
-            WebDriverWait(self.driver, timeout).until(
+            TimedWait(self.driver, timeout).until(
                 EC.invisibility_of_element_located((By.CSS_SELECTOR, ".cdk-overlay-pane"))
             )
         except TimeoutException:
@@ -82,7 +319,7 @@ class BasePage:
                 except Exception:
                     self.driver.execute_script("arguments[0].click();", bd)
             if timeout:
-                WebDriverWait(self.driver, timeout).until(
+                TimedWait(self.driver, timeout).until(
                     EC.invisibility_of_element_located(
                         (By.CSS_SELECTOR, ".cdk-overlay-backdrop.cdk-overlay-backdrop-showing")
                     )
@@ -91,6 +328,42 @@ class BasePage:
             pass
 
     # ---------------- toast helpers (stale-safe) ----------------
+    def _install_toast_watcher(self):
+        """Idempotent; re-run after full page loads, which wipe the watcher."""
+        try:
+            self.driver.execute_script(_TOAST_WATCHER_JS)
+            return True
+        except Exception:
+            return False
+
+    # ---------------- batched DOM queries ----------------
+    def query_nodes(
+        self, selectors, within=None, text_selector=None, visible_only=True, xpath=False
+    ):
+        """
+        Find nodes matching any of `selectors` (CSS, or XPath with xpath=True) in a
+        single execute_script and return dicts {el, visible, text, rect}.
+        `within`: CSS selectors for container roots (falls back to <body> if none
+        exist; invisible containers are skipped). `text_selector`: prefer the text
+        of the last matching child over the node's own innerText.
+        """
+        if isinstance(selectors, str):
+            selectors = [selectors]
+        try:
+            return (
+                self.driver.execute_script(
+                    _QUERY_NODES_JS,
+                    list(selectors),
+                    list(within or []),
+                    text_selector,
+                    visible_only,
+                    xpath,
+                )
+                or []
+            )
+        except StaleElementReferenceException:
+            return []
+
     def _find_toast_messages(self):
         """
         Return list of (toast_element, message_text) for any *visible* toast-ish node.
@@ -98,121 +371,24 @@ class BasePage:
           1) ngx-toastr under [toastcontainer] #toast-container …
           2) polite live-region container: [role="status"] #toast-container …
           3) visible nodes with classes containing 'toast'/'notification'/'alert'
-        Always reads text via innerText (fallback to .text). Robust to stale elements.
+        Always reads text via innerText. One WebDriver round trip.
         """
-        results = []
-        containers = []
-
-        # Known containers
-        try:
-            containers += self.driver.find_elements(
-                By.CSS_SELECTOR, "[toastcontainer] #toast-container.toast-container"
-            )
-        except Exception:
-            pass
-        try:
-            containers += self.driver.find_elements(
-                By.CSS_SELECTOR, "#toast-container.toast-container"
-            )
-        except Exception:
-            pass
-        try:
-            containers += self.driver.find_elements(
-                By.CSS_SELECTOR, '[role="status"] #toast-container.toast-container'
-            )
-        except Exception:
-            pass
-
-        def _gather_in(container_or_root):
-            sels = [
+        nodes = self.query_nodes(
+            [
                 ".ngx-toastr",
                 ".toast",
                 "[class*='toast']",
                 "[class*='notification']",
                 "[class*='alert']",
-            ]
-            found = []
-            for sel in sels:
-                try:
-                    found += container_or_root.find_elements(By.CSS_SELECTOR, sel)
-                except Exception:
-                    pass
-            return found
-
-        # If we didn't find explicit containers, search whole body
-        if not containers:
-            try:
-                containers = [self.driver.find_element(By.TAG_NAME, "body")]
-            except Exception:
-                containers = []
-
-        for cont in containers:
-            # skip invisible/stale containers
-            try:
-                if hasattr(cont, "is_displayed") and not cont.is_displayed():
-                    continue
-            except StaleElementReferenceException:
-                continue
-            except Exception:
-                pass
-
-            candidates = _gather_in(cont)
-            for node in candidates:
-                # ensure visible & not stale
-                try:
-                    if hasattr(node, "is_displayed") and not node.is_displayed():
-                        continue
-                except StaleElementReferenceException:
-                    continue
-                except Exception:
-                    pass
-
-                msg_text = ""
-                # try a dedicated message child
-                try:
-                    msg_els = node.find_elements(By.CSS_SELECTOR, ".toast-message, .message")
-                except StaleElementReferenceException:
-                    continue
-                except Exception:
-                    msg_els = []
-
-                if msg_els:
-                    try:
-                        msg_text = (
-                            self.driver.execute_script(
-                                "return arguments[0].innerText || '';", msg_els[-1]
-                            )
-                            or ""
-                        ).strip()
-                    except StaleElementReferenceException:
-                        continue
-                    except Exception:
-                        pass
-
-                # fallback to node's innerText / text
-                if not msg_text:
-                    try:
-                        msg_text = (
-                            self.driver.execute_script("return arguments[0].innerText || '';", node)
-                            or ""
-                        ).strip()
-                    except StaleElementReferenceException:
-                        continue
-                    except Exception:
-                        pass
-
-                    if not msg_text:
-                        try:
-                            msg_text = (node.text or "").strip()
-                        except StaleElementReferenceException:
-                            continue
-                        except Exception:
-                            pass
-
-                if msg_text:
-                    results.append((node, msg_text))
-
-        return results
+            ],
+            within=[
+                "[toastcontainer] #toast-container.toast-container",
+                "#toast-container.toast-container",
+                '[role="status"] #toast-container.toast-container',
+            ],
+            text_selector=".toast-message, .message",
+        )
+        return [(n["el"], n["text"]) for n in nodes if n["text"]]
 
     def _dismiss_toast_element(self, toast_el):
         if not toast_el:
@@ -252,18 +428,40 @@ class BasePage:
     ):
         """
         Wait for a toast-ish node to show non-empty text, assert it matches expected_text (or any_of),
-        then optionally dismiss it. Robust to stales while the DOM repaints.
+        then optionally dismiss it. Uses the in-page toast watcher (one async script call);
+        falls back to DOM polling if the watcher can't run.
         """
         wanted = [expected_text] if expected_text else []
         if any_of:
             wanted.extend([w for w in any_of if w])
         wanted = [w for w in wanted if w]
 
-        # small grace so UI can render the toast after a click/save
+        if not self._install_toast_watcher():
+            return self._assert_toast_polling(wanted, timeout, dismiss)
         try:
-            self.driver.execute_script("return new Promise(r=>setTimeout(r, 120));")
-        except Exception:
-            pass
+            self.driver.set_script_timeout(timeout + 5)
+            result = self.driver.execute_async_script(_TOAST_AWAIT_JS, wanted, int(timeout * 1000))
+        except WebDriverException:
+            # e.g. a full navigation replaced the document mid-wait
+            return self._assert_toast_polling(wanted, timeout, dismiss)
+
+        if result and result.get("text"):
+            if dismiss:
+                self._dismiss_toast_element(result.get("el"))
+            return self
+
+        last_text = (result or {}).get("last") or ""
+        if last_text:
+            raise AssertionError(
+                f"Toast text did not match within {timeout}s. Saw: {last_text!r} "
+                f"Wanted: {wanted or '[any non-empty]'}"
+            )
+        raise AssertionError("No toast text found within timeout in known containers/selectors.")
+
+    def _assert_toast_polling(self, wanted: list, timeout: int, dismiss: bool):
+        """Fallback for assert_toast_message: poll the DOM for visible toasts."""
+        # let the UI finish the click/save round trip before scanning
+        self.wait_for_app_idle(timeout=2)
 
         try:
             deadline = self.driver.execute_script("return Date.now() + arguments[0]*1000;", timeout)
@@ -312,6 +510,24 @@ class BasePage:
             )
         raise AssertionError("No toast text found within timeout in known containers/selectors.")
 
+    # ---------------- learned locators ----------------
+    def locate(self, name, strategies, timeout=10, visible=True, text=False):
+        """
+        Element for logical locator `name` from a fallback chain of (By, selector)
+        `strategies`. The strategy that worked last time on this web-vault version
+        goes first, and all of them are raced in one script call, so a fallback
+        costs no extra timeout. Raises TimeoutException when nothing matches.
+        """
+        version = web_vault_version(self.driver)
+        ordered = LOCATORS.order(version, name, strategies)
+        with TRACER.timed("wait"):
+            hit = race(self.driver, ordered, visible, text, timeout)
+        if hit is None:
+            raise TimeoutException(f"No strategy located '{name}' within {timeout}s")
+        index, el = hit
+        LOCATORS.record(version, name, ordered[index])
+        return el
+
     # ---------------- public API ----------------
     def wait_for_element(self, by, value):
         return self.wait.until(EC.presence_of_element_located((by, value)))
@@ -339,3 +555,6 @@ class BasePage:
         element = self.wait_for_element(by, value)
         element.send_keys(text)
         return self
+
+
+instrument_actions(BasePage)
@@ -3,23 +3,77 @@ import time
 
 from selenium.common.exceptions import (
     ElementClickInterceptedException,
+    NoSuchElementException,
     StaleElementReferenceException,
     TimeoutException,
 )
 from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as EC
 
+from tests.ui.tracing import TRACER, TimedWait
+
 from .base_page import BasePage
 from .item_page import ItemPage
 
+# Find a row by its exact (whitespace-normalized) name among the rendered rows.
+# With scroll=true and no hit, page the virtual viewport (starting at a cached
+# offset) until the row renders or the end is reached.
+_ROW_SEEK_JS = r"""
+const [name, scroll, start, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+const norm = (t) => (t || '').replace(/\s+/g, ' ').trim();
+const find = () => {
+  for (const tr of document.querySelectorAll('table tbody tr[bitrow]')) {
+    const buttons = tr.querySelectorAll('button.tw-font-semibold, button[bitlink]');
+    if ([...buttons].some((b) => norm(b.textContent) === name)) return tr;
+  }
+  return null;
+};
+let hit = find();
+if (hit || !scroll) return done(hit ? { row: hit, top: null } : null);
+
+const table = document.querySelector('table');
+if (!table) return done(null);
+let vp = table.parentElement;
+while (vp && vp !== document.body) {
+  const st = getComputedStyle(vp);
+  if (/(auto|scroll)/.test(st.overflowY) && vp.scrollHeight > vp.clientHeight) break;
+  vp = vp.parentElement;
+}
+if (!vp || vp === document.body) vp = document.scrollingElement;
+const page = Math.max(vp.clientHeight * 0.9, 200);
+const deadline = Date.now() + timeoutMs;
+const frame = () => new Promise((r) => requestAnimationFrame(() => setTimeout(r, 30)));
+(async () => {
+  for (const from of start != null ? [start, 0] : [0]) {
+    vp.scrollTop = from;
+    await frame();
+    while (Date.now() < deadline) {
+      if ((hit = find())) {
+        const top = vp.scrollTop;
+        hit.scrollIntoView({ block: 'center' });
+        await frame();
+        return { row: find() || hit, top };
+      }
+      if (vp.scrollTop + vp.clientHeight >= vp.scrollHeight - 1) break;
+      vp.scrollTop += page;
+      await frame();
+    }
+  }
+  return null;
+})().then(done, () => done(null));
+"""
+
+_SEARCH_BOX = "input[type='search'], input[placeholder^='Search']"
+
+# _row_by_name's retry window; each attempt's waits stay well inside it
+_ROW_RETRY_S = 8.0
+
 
 class DashboardPage(BasePage):
-    # ---- tiny local sleep (no BasePage dependency) ----
-    def _tiny_sleep(self, ms: int = 150):
-        try:
-            self.driver.execute_script("return new Promise(r => setTimeout(r, arguments[0]));", ms)
-        except Exception:
-            time.sleep(ms / 1000.0)
+    # (view route, item name) -> viewport scrollTop where the row last rendered
+    _row_positions = {}
 
     # ---- generic retry for stale DOM ----
     def _retry(self, fn, timeout=8.0, pause=0.2):
@@ -28,13 +82,15 @@ class DashboardPage(BasePage):
         while time.time() < end:
             try:
                 return fn()
-            except StaleElementReferenceException as e:
-                last_err = e
-                self._tiny_sleep(int(pause * 1000))
             except Exception as e:
-                # minor settle and retry — DOM can still be repainting
+                # DOM is still repainting: wait until the app settles, not a fixed pause
                 last_err = e
-                self._tiny_sleep(int(pause * 1000))
+                # capped slice: a never-idle page must still leave time for more attempts
+                remaining = max(end - time.time(), 0.1)
+                with TRACER.timed("retry"):
+                    self.wait_for_app_idle(
+                        timeout=min(pause * 5, remaining), min_wait_ms=int(pause * 1000)
+                    )
         if last_err:
             raise last_err
         raise AssertionError("Retry timed out")
@@ -45,13 +101,12 @@ class DashboardPage(BasePage):
 
     def select_menu_item(self, item_text):
         self.wait_for_element(By.CSS_SELECTOR, "button[role='menuitem']")
-        items = self.driver.find_elements(By.CSS_SELECTOR, "button[role='menuitem']")
-        for it in items:
-            if item_text.lower() in (it.text or "").lower():
+        for it in self.query_nodes("button[role='menuitem']", visible_only=False):
+            if item_text.lower() in it["text"].lower():
                 try:
-                    it.click()
+                    it["el"].click()
                 except Exception:
-                    self.driver.execute_script("arguments[0].click();", it)
+                    self.driver.execute_script("arguments[0].click();", it["el"])
                 break
         return ItemPage(self.driver)
 
@@ -63,17 +118,64 @@ class DashboardPage(BasePage):
             f"and normalize-space()='{name}']]"
         )
 
+    def _seek_row(self, name, scroll=False, timeout=10.0):
+        """One script call: the rendered row for `name`, or None (see _ROW_SEEK_JS)."""
+        route = self.driver.current_url.split("#", 1)[-1]
+        key = (route, name)
+        self.driver.set_script_timeout(timeout + 5)
+        hit = self.driver.execute_async_script(
+            _ROW_SEEK_JS, name, scroll, self._row_positions.get(key), int(timeout * 1000)
+        )
+        if not hit:
+            return None
+        if hit.get("top") is not None:
+            self._row_positions[key] = hit["top"]
+        return hit["row"]
+
+    def _filter_by_search(self, text) -> bool:
+        """Narrow the list with the vault/trash search box. False if there is none."""
+        boxes = self.query_nodes(_SEARCH_BOX)
+        if not boxes:
+            return False
+        box = boxes[0]["el"]
+        if (box.get_attribute("value") or "") != text:
+            box.clear()
+            box.send_keys(text)
+            self.wait_for_app_idle(timeout=3, min_wait_ms=250)  # search input is debounced
+        return True
+
+    def clear_search(self):
+        for node in self.query_nodes(_SEARCH_BOX):
+            if node["el"].get_attribute("value"):
+                node["el"].clear()
+                node["el"].send_keys(" ", Keys.BACKSPACE)  # fire input so the filter resets
+                self.wait_for_app_idle(timeout=3)
+        return self
+
     def _row_by_name(self, name):
-        xpath = self._row_by_name_xpath(name)
+        """
+        Row for `name` in a possibly virtualized table: rendered rows first,
+        then the search box to narrow the list, then paging the viewport
+        (from the last known offset) when there is no search box.
+        """
 
         def locate():
             self._dismiss_backdrops(0.1)
-            self.wait.until(EC.presence_of_element_located((By.XPATH, xpath)))
-            row = self.driver.find_element(By.XPATH, xpath)
-            _ = row.is_displayed()  # forces refetch if stale
+            row = self._seek_row(name)
+            if row is None and self._filter_by_search(name):
+                try:
+                    row = TimedWait(self.driver, _ROW_RETRY_S / 4).until(
+                        lambda d: self._seek_row(name) or False
+                    )
+                except TimeoutException:
+                    row = None
+            if row is None:
+                row = self._seek_row(name, scroll=True, timeout=_ROW_RETRY_S / 3)
+            if row is None:
+                raise NoSuchElementException(f"No row named '{name}'")
             return row
 
-        return self._retry(locate, timeout=8.0, pause=0.2)
+        return self._retry(locate, timeout=_ROW_RETRY_S, pause=0.2)
 
     # ---------- open item name (to View dialog) ----------
     def open_item_by_name(self, item_name: str) -> ItemPage:
@@ -83,17 +185,18 @@ class DashboardPage(BasePage):
         )
         row = self._row_by_name(item_name)
 
+        # the row's name button, not just its first link-styled one
+        name_button = (
+            ".//button[(contains(@class,'tw-font-semibold') or @bitlink) "
+            f"and normalize-space()='{item_name}']"
+        )
+
         def click_name():
             try:
-                btn = row.find_element(
-                    By.XPATH,
-                    ".//button[(contains(@class,'tw-font-semibold') or @bitlink)]",
-                )
+                btn = row.find_element(By.XPATH, name_button)
             except Exception:
                 fresh_row = self._row_by_name(item_name)
-                btn = fresh_row.find_element(
-                    By.XPATH, ".//button[(contains(@class,'tw-font-semibold') or @bitlink)]"
-                )
+                btn = fresh_row.find_element(By.XPATH, name_button)
 
             try:
                 btn.click()
@@ -152,7 +255,7 @@ class DashboardPage(BasePage):
                 "//button[contains(@class,'filter-button')][contains(normalize-space(.),'Trash')]",
             )
 
-        # wait for trash view & allow a short repaint settle to avoid stale nodes
+        # wait for trash view & let the list finish repainting to avoid stale nodes
         try:
             self.wait.until(
                 EC.presence_of_element_located(
@@ -169,7 +272,7 @@ class DashboardPage(BasePage):
                 )
             )
 
-        self._tiny_sleep(200)
+        self.wait_for_app_idle()
         return self
 
     def go_to_all_items(self):
@@ -186,7 +289,7 @@ class DashboardPage(BasePage):
         self.wait.until(
             EC.presence_of_element_located((By.XPATH, "//table|//button[contains(.,'New item')]"))
         )
-        self._tiny_sleep(150)
+        self.wait_for_app_idle()
         return self
 
     # ---------- assertions ----------
@@ -197,9 +300,9 @@ class DashboardPage(BasePage):
     def assert_row_absent(self, item_name: str, timeout: int = 5):
         xpath = self._row_by_name_xpath(item_name)
         try:
-            from selenium.webdriver.support.ui import WebDriverWait
-
-            WebDriverWait(self.driver, timeout).until_not(
+            # off-screen rows of a virtualized table aren't in the DOM; filter first
+            self._filter_by_search(item_name)
+            TimedWait(self.driver, timeout).until_not(
                 EC.presence_of_element_located((By.XPATH, xpath))
             )
             return self
@@ -214,14 +317,12 @@ class DashboardPage(BasePage):
         self.open_item_options_for(item_name)
 
         def click_restore():
-            items = self.driver.find_elements(By.CSS_SELECTOR, "button[role='menuitem']")
-            for b in items:
-                txt = (b.text or "").strip().lower()
-                if "restore" in txt:
+            for b in self.query_nodes("button[role='menuitem']", visible_only=False):
+                if "restore" in b["text"].lower():
                     try:
-                        b.click()
+                        b["el"].click()
                     except Exception:
-                        self.driver.execute_script("arguments[0].click();", b)
+                        self.driver.execute_script("arguments[0].click();", b["el"])
                     return True
             raise StaleElementReferenceException("Restore not found yet")
 
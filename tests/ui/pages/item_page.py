@@ -115,16 +115,16 @@ class ItemPage(BasePage):
         return self
 
     def click_delete(self):
-        items = self.wait.until(
+        self.wait.until(
             EC.presence_of_all_elements_located((By.CSS_SELECTOR, 'button[role="menuitem"]'))
         )
-        for b in items:
-            if "delete" in (b.text or "").lower():
+        for b in self.query_nodes('button[role="menuitem"]', visible_only=False):
+            if "delete" in b["text"].lower():
                 try:
-                    b.click()
+                    b["el"].click()
                 except ElementClickInterceptedException:
                     self._wait_for_no_overlay(15)
-                    self.driver.execute_script("arguments[0].click();", b)
+                    self.driver.execute_script("arguments[0].click();", b["el"])
                 return self
         raise AssertionError("Delete menu item not found")
 
@@ -144,22 +144,22 @@ class ItemPage(BasePage):
             "cdk-dialog-container button[title='Close']",
             "cdk-dialog-container .dialog-close",
         ]
-        for sel in selectors:
+        try:
+            btn = self.locate(
+                "item_dialog.close", [(By.CSS_SELECTOR, sel) for sel in selectors], timeout=15
+            )
             try:
-                btn = self.wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, sel)))
-                try:
-                    btn.click()
-                except ElementClickInterceptedException:
-                    self._wait_for_no_overlay(2)
-                    self.driver.execute_script("arguments[0].click();", btn)
-                # ensure the dialog actually closed
-                self._wait_for_no_overlay(5)
-                return self
-            except Exception:
-                continue
-        # last resort
-        self._dismiss_dialogs(timeout=5)
-        return self
+                btn.click()
+            except ElementClickInterceptedException:
+                self._wait_for_no_overlay(2)
+                self.driver.execute_script("arguments[0].click();", btn)
+            # ensure the dialog actually closed
+            self._wait_for_no_overlay(5)
+            return self
+        except Exception:
+            # last resort
+            self._dismiss_dialogs(timeout=5)
+            return self
 
     # ---------------- NEW: click the 'Edit' button in the dialog footer ----------------
     def click_edit(self):
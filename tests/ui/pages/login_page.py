@@ -1,5 +1,4 @@
 # tests/ui/pages/login_page.py
-from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 
 from .base_page import BasePage
@@ -8,10 +7,13 @@ from .dashboard_page import DashboardPage
 
 class LoginPage(BasePage):
     def enter_email(self, email):
-        try:
-            return self.enter_text(By.ID, "bit-input-0", email)
-        except TimeoutException:
-            return self.enter_text(By.CSS_SELECTOR, 'input[type="email"]', email)
+        field = self.locate(
+            "login.email",
+            [(By.ID, "bit-input-0"), (By.CSS_SELECTOR, 'input[type="email"]')],
+            timeout=30,
+        )
+        field.send_keys(email)
+        return self
 
     def click_continue(self):
         return self.click_element(By.CSS_SELECTOR, 'button[buttontype="primary"]')
@@ -1,6 +1,6 @@
 # tests/ui/pages/view_item_page.py
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
 
 from .base_page import BasePage
 from .item_page import ItemPage
@@ -19,15 +19,11 @@ class ViewItemPage(BasePage):
                 "//div[contains(@class,'item-view') or contains(@class,'dialog')]//*[self::h2 or self::h3 or self::strong]",
             ),
         ]
-        title_text = ""
-        for by, sel in candidates:
-            try:
-                el = self.wait.until(EC.presence_of_element_located((by, sel)))
-                title_text = (el.text or "").strip()
-                if title_text:
-                    break
-            except Exception:
-                continue
+        try:
+            el = self.locate("item_view.title", candidates, timeout=30, visible=False, text=True)
+            title_text = (el.text or "").strip()
+        except TimeoutException:
+            title_text = ""
         if title_text and item_name.lower() not in title_text.lower():
             raise AssertionError(f"Expected view of '{item_name}', saw title '{title_text}'")
         return self
@@ -38,29 +34,17 @@ class ViewItemPage(BasePage):
         - Save button is visible (it exists but starts hidden), OR
         - any edit field (e.g., formcontrolname='name') is interactable.
         """
-        # 1) Save button becomes visible (it exists but starts hidden)
-        try:
-            save_btn = self.wait.until(
-                EC.presence_of_element_located(
-                    (By.CSS_SELECTOR, "button[form='cipherForm'][type='submit']")
-                )
-            )
-            self.wait.until(lambda d: save_btn.is_displayed())
-            return
-        except Exception:
-            pass
-
-        # 2) Fallback: a known edit input is present and enabled
         try:
-            name_input = self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "input[formcontrolname='name']"))
+            self.locate(
+                "item_dialog.edit_mode",
+                [
+                    (By.CSS_SELECTOR, "button[form='cipherForm'][type='submit']"),
+                    (By.CSS_SELECTOR, "input[formcontrolname='name']:not([disabled])"),
+                ],
+                timeout=30,
             )
-            self.wait.until(lambda d: name_input.is_enabled())
-            return
-        except Exception:
-            pass
-
-        raise AssertionError("Edit mode did not appear (Save button/input not visible).")
+        except TimeoutException:
+            raise AssertionError("Edit mode did not appear (Save button/input not visible).")
 
     def _js_click_edit_in_dialog(self) -> bool:
         """
@@ -123,38 +107,35 @@ class ViewItemPage(BasePage):
 
     def click_edit(self) -> ItemPage:
         """
-        Click the 'Edit' button inside the active CDK dialog using several strategies:
-          1) Strict relative lookup within the dialog footer (text='Edit').
-          2) Absolute XPath fallback (from your inspected DOM).
-          3) JS-driven click that finds and dispatches a synthetic click.
+        Click the 'Edit' button inside the active CDK dialog. Strategies (raced,
+        last winner first): text='Edit' in the dialog footer, the primary footer
+        button, the absolute XPath from the inspected DOM; then a JS-driven click.
         Then wait for edit mode (Save visible or inputs enabled).
         """
-        self._kill_blockers()
-
-        # Ensure dialog is up
-        dialog = self.wait.until(
-            EC.presence_of_element_located(
-                (By.CSS_SELECTOR, "cdk-dialog-container app-vault-item-dialog bit-dialog")
+        self._dismiss_backdrops(0.2)
+        try:
+            edit_btn = self.locate(
+                "item_dialog.edit",
+                [
+                    (
+                        By.XPATH,
+                        "//cdk-dialog-container//app-vault-item-dialog//bit-dialog//section//footer"
+                        "//button[.//span[normalize-space()='Edit'] or normalize-space()='Edit']",
+                    ),
+                    (
+                        By.CSS_SELECTOR,
+                        "cdk-dialog-container app-vault-item-dialog bit-dialog "
+                        "section footer button[buttontype='primary'][type='button']",
+                    ),
+                    (
+                        By.XPATH,
+                        "/html/body/div[1]/div[2]/div/cdk-dialog-container/app-vault-item-dialog/bit-dialog/section/footer/button[1]",
+                    ),
+                ],
+                timeout=30,
             )
-        )
-
-        # Strategy 1: strict within-dialog locator
-        edit_btn = None
-        for loc in [
-            (
-                By.XPATH,
-                ".//section//footer//button[.//span[normalize-space()='Edit'] or normalize-space()='Edit']",
-            ),
-            (By.CSS_SELECTOR, "section footer button[buttontype='primary'][type='button']"),
-        ]:
-            try:
-                candidates = dialog.find_elements(*loc)
-                candidates = [c for c in candidates if c.is_displayed()]
-                if candidates:
-                    edit_btn = candidates[0]
-                    break
-            except Exception:
-                continue
+        except TimeoutException:
+            edit_btn = None
 
         if edit_btn:
             try:
@@ -163,37 +144,13 @@ class ViewItemPage(BasePage):
                 )
             except Exception:
                 pass
-            self._kill_blockers()
-            try:
-                self.wait.until(EC.element_to_be_clickable(edit_btn))
-            except Exception:
-                pass
+            self._dismiss_backdrops(0.2)
             try:
                 edit_btn.click()
             except Exception:
                 self.driver.execute_script("arguments[0].click();", edit_btn)
-        else:
-            # Strategy 2: your absolute XPath as a fallback
-            try:
-                abs_btn = self.driver.find_element(
-                    By.XPATH,
-                    "/html/body/div[1]/div[2]/div/cdk-dialog-container/app-vault-item-dialog/bit-dialog/section/footer/button[1]",
-                )
-                try:
-                    self.driver.execute_script(
-                        "arguments[0].scrollIntoView({block:'center'});", abs_btn
-                    )
-                except Exception:
-                    pass
-                self._kill_blockers()
-                try:
-                    abs_btn.click()
-                except Exception:
-                    self.driver.execute_script("arguments[0].click();", abs_btn)
-            except Exception:
-                # Strategy 3: pure JS click in dialog footer
-                if not self._js_click_edit_in_dialog():
-                    raise AssertionError("Edit button not found/clickable in dialog")
+        elif not self._js_click_edit_in_dialog():
+            raise AssertionError("Edit button not found/clickable in dialog")
 
         # Wait for edit UI
         self._ensure_edit_mode()
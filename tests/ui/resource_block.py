@@ -0,0 +1,82 @@
+# tests/ui/resource_block.py
+import os
+
+from selenium.common.exceptions import WebDriverException
+
+from tests.common.envtools import env_flag
+
+# Website icons are fetched per item (/icons/<domain>/icon.png); the rest is telemetry
+ICON_PATTERN = "*/icons/*/icon.png"
+DEFAULT_BLOCKED = (
+    ICON_PATTERN,
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*.sentry.io*",
+)
+
+# Swap website-icon URLs for an inline 1x1 GIF before the <img> ever requests them,
+# so the vault renders its normal icon slot without a failed load per row.
+_ICON_STUB_JS = r"""
+(() => {
+  const STUB = 'data:image/gif;base64,R0lGODlhAQABAIAAAAAAAP///yH5BAEAAAAALAAAAAABAAEAAAIBRAA7';
+  const isIcon = (v) => typeof v === 'string' && /\/icons\/[^/]+\/icon\.png(\?|$)/.test(v);
+  const proto = HTMLImageElement.prototype;
+  const desc = Object.getOwnPropertyDescriptor(proto, 'src');
+  Object.defineProperty(proto, 'src', {
+    configurable: true, enumerable: desc.enumerable, get: desc.get,
+    set(v) { desc.set.call(this, isIcon(v) ? STUB : v); },
+  });
+  const setAttr = Element.prototype.setAttribute;
+  Element.prototype.setAttribute = function (name, value) {
+    if (this instanceof HTMLImageElement && String(name).toLowerCase() === 'src' && isIcon(value)) {
+      value = STUB;
+    }
+    return setAttr.call(this, name, value);
+  };
+})();
+"""
+
+
+def blocking_enabled() -> bool:
+    """VW_BLOCK_RESOURCES=1: keep icons/telemetry (and VW_BLOCK_URLS) off the wire."""
+    return env_flag("VW_BLOCK_RESOURCES")
+
+
+def _env_list(name):
+    return [p.strip() for p in os.getenv(name, "").split(",") if p.strip()]
+
+
+def blocked_patterns() -> list:
+    """
+    DEFAULT_BLOCKED plus VW_BLOCK_URLS (comma-separated, `*` wildcards, e.g.
+    "*.woff2,*/notifications/hub*"), minus the patterns listed verbatim in
+    VW_UNBLOCK_PATTERNS (e.g. "*.sentry.io*"). That drops block patterns; it is
+    not a per-URL allow list, since Network.setBlockedURLs only takes patterns.
+    """
+    drop = set(_env_list("VW_UNBLOCK_PATTERNS"))
+    patterns = []
+    for p in list(DEFAULT_BLOCKED) + _env_list("VW_BLOCK_URLS"):
+        if p in patterns or p in drop:
+            continue
+        patterns.append(p)
+    return patterns
+
+
+def apply_blocking(driver) -> list:
+    """
+    Install the block list on this Chrome via CDP (Network.setBlockedURLs) and,
+    while icons are blocked, the in-page icon stub. Settings live as long as the
+    browser session, so pooled browsers only need this once. Returns the patterns.
+    """
+    patterns = blocked_patterns()
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        if ICON_PATTERN in patterns:
+            driver.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument", {"source": _ICON_STUB_JS}
+            )
+    except WebDriverException:
+        # not a Chromium driver / CDP unavailable: run unblocked rather than fail
+        return []
+    return patterns
@@ -1,31 +1,27 @@
 # tests/ui/test_creating_items.py
 import os
 
+from tests.common.envtools import ui_credentials
 from tests.ui.base_ui import BaseVaultwardenTest
-from tests.ui.pages.login_page import LoginPage
 
-EMAIL = os.getenv("VW_EMAIL")
-PASSWORD = os.getenv("VW_PASSWORD")
+EMAIL, PASSWORD = ui_credentials(os.getenv("VW_EMAIL"), os.getenv("VW_PASSWORD"))
 
 
 class CreatingItemsTest(BaseVaultwardenTest):
     def test_create_new_item(self):
+        name = self.unique_name("Test Login Item")
         (
-            LoginPage(self.driver)
-            .enter_email(EMAIL)
-            .click_continue()
-            .enter_password(PASSWORD)
-            .click_login()
+            self.login(EMAIL, PASSWORD)
             .click_new_button()
             .select_menu_item("Login")
-            .enter_item_name("Test Login Item")
+            .enter_item_name(name)
             .enter_item_username("testuser")
             .enter_item_password("testpassword")
             .enter_website("https://example.com")
             .save_item()
             .assert_toast_message("Item added")
             .close_popup()
-            .open_item_options_for("Test Login Item")
+            .open_item_options_for(name)
             .click_delete()
             .confirm_delete()
             .assert_toast_message("Item sent to trash")
@@ -1,40 +1,24 @@
 import os
-import uuid
 
+from tests.common.envtools import ui_credentials
 from tests.ui.base_ui import BaseVaultwardenTest
-from tests.ui.pages.dashboard_page import DashboardPage
-from tests.ui.pages.login_page import LoginPage
 
-EMAIL = os.getenv("VW_EMAIL", "hadixserhan@gmail.com")
-PASSWORD = os.getenv("VW_PASSWORD", "Hadi123456789123")
+EMAIL, PASSWORD = ui_credentials(
+    os.getenv("VW_EMAIL", "hadixserhan@gmail.com"), os.getenv("VW_PASSWORD", "Hadi123456789123")
+)
 
 
 class EditItemTest(BaseVaultwardenTest):
     def test_edit_item_username_and_cleanup(self):
-        # unique item name to avoid collisions
-        name = f"EditFlow {str(uuid.uuid4())[:6]}"
+        # unique item name to avoid collisions (also across parallel workers)
+        name = self.unique_name("EditFlow")
         new_user = "after_user"
 
-        # Create item
-        (
-            LoginPage(self.driver)
-            .enter_email(EMAIL)
-            .click_continue()
-            .enter_password(PASSWORD)
-            .click_login()
-            .click_new_button()
-            .select_menu_item("Login")
-            .enter_item_name(name)
-            .enter_item_username("before_user")
-            .enter_item_password("before_pass")
-            .enter_website("https://example.com")
-            .save_item()
-            .assert_toast_message(any_of=["Item added", "Item saved", "Item created"], timeout=10)
-            .close_popup()
-        )
+        # Precondition: the item exists (created through the API when possible)
+        self.given_login_item(EMAIL, PASSWORD, name, "before_user", "before_pass")
+        dp = self.login(EMAIL, PASSWORD)
 
         # Open item by name → View dialog → click Edit
-        dp = DashboardPage(self.driver)
         (
             dp.open_item_by_name(name)
             .click_edit_in_view()
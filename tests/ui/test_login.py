@@ -0,0 +1,18 @@
+# tests/ui/test_login.py
+import os
+
+from selenium.webdriver.common.by import By
+
+from tests.common.envtools import ui_credentials
+from tests.ui.base_ui import BaseVaultwardenTest
+
+EMAIL, PASSWORD = ui_credentials(os.getenv("VW_EMAIL"), os.getenv("VW_PASSWORD"))
+
+
+class LoginTest(BaseVaultwardenTest):
+    def test_login_flow(self):
+        # Other UI tests may restore a saved session; this one always exercises
+        # the real email → Continue → master password (client-side KDF) flow.
+        dashboard = self.login(EMAIL, PASSWORD, fresh=True)
+        dashboard.wait_for_element(By.XPATH, "//table|//button[contains(.,'New item')]")
+        self.assertIn("Vault", self.driver.title or "")
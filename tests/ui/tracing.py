@@ -0,0 +1,304 @@
+# tests/ui/tracing.py
+import inspect
+import json
+import os
+import secrets
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+
+import requests
+from selenium.webdriver.support.ui import WebDriverWait
+
+from tests.common.envtools import env_flag, worker_id
+from tests.ui.netcapture import recorder_for
+
+try:
+    import allure
+except ImportError:  # pragma: no cover - allure-pytest is optional locally
+    allure = None
+
+# WebDriver command -> breakdown bucket on the enclosing action span
+_COMMAND_KIND = {
+    "findElement": "locate",
+    "findElements": "locate",
+    "findChildElement": "locate",
+    "findChildElements": "locate",
+    "clickElement": "click",
+    "sendKeysToElement": "input",
+    "clearElement": "input",
+    "w3cExecuteScript": "script",
+    "w3cExecuteScriptAsync": "script",
+    "get": "navigate",
+    "refresh": "navigate",
+}
+
+
+def tracing_enabled() -> bool:
+    """VW_TRACE=1 (or a VW_TRACE_FILE / VW_TRACE_ENDPOINT): time every page-object action."""
+    return bool(
+        env_flag("VW_TRACE") or os.getenv("VW_TRACE_FILE") or os.getenv("VW_TRACE_ENDPOINT")
+    )
+
+
+class Span:
+    """One timed operation, shaped after an OpenTelemetry span."""
+
+    def __init__(self, name, trace_id, parent_id=None, attributes=None):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.attributes = dict(attributes or {})
+        self.counters = {}  # "<kind>_ms" / "<kind>_count", rolled up into the parent
+        self.start_ns = time.time_ns()
+        self.end_ns = None
+        self.error = None
+
+    def add(self, kind, seconds, count=1):
+        self.counters[f"{kind}_ms"] = self.counters.get(f"{kind}_ms", 0.0) + seconds * 1000
+        self.counters[f"{kind}_count"] = self.counters.get(f"{kind}_count", 0) + count
+
+    def to_otlp(self) -> dict:
+        attrs = dict(self.attributes)
+        attrs.update(
+            {
+                f"vw.{k}": round(v, 1) if isinstance(v, float) else v
+                for k, v in self.counters.items()
+            }
+        )
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,  # INTERNAL
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or time.time_ns()),
+            "attributes": [{"key": k, "value": _otlp_value(v)} for k, v in attrs.items()],
+            "status": {"code": 2, "message": self.error} if self.error else {"code": 1},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+def _otlp_value(v) -> dict:
+    if isinstance(v, bool):
+        return {"boolValue": v}
+    if isinstance(v, int):
+        return {"intValue": str(v)}
+    if isinstance(v, float):
+        return {"doubleValue": v}
+    return {"stringValue": str(v)}
+
+
+class Tracer:
+    """
+    Per-thread span stack. Action spans nest under the test's root span; their
+    WebDriver command time is bucketed (locate/click/input/script/navigate),
+    explicit waits and retries are timed separately, and every bucket rolls up
+    into the parent so a root span carries the whole test's breakdown.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._finished = []
+        self._lock = threading.Lock()
+
+    def _stack(self) -> list:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+            self._local.in_wait = 0
+        return self._local.stack
+
+    def current(self):
+        stack = self._stack()
+        return stack[-1] if stack else None
+
+    def start(self, name, **attributes) -> Span:
+        parent = self.current()
+        span = Span(
+            name,
+            parent.trace_id if parent else secrets.token_hex(16),
+            parent.span_id if parent else None,
+            attributes,
+        )
+        self._stack().append(span)
+        return span
+
+    def end(self, span: Span):
+        stack = self._stack()
+        if span in stack:
+            del stack[stack.index(span) :]
+        span.end_ns = time.time_ns()
+        parent = self.current()
+        if parent is not None:
+            for k, v in span.counters.items():
+                parent.counters[k] = parent.counters.get(k, 0) + v
+        with self._lock:
+            self._finished.append(span)
+
+    @contextmanager
+    def span(self, name, **attributes):
+        span = self.start(name, **attributes)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            self.end(span)
+
+    @contextmanager
+    def timed(self, kind):
+        """Add the block's duration to the current span under `kind` (wait, retry...)."""
+        span = self.current()
+        if span is None:
+            yield
+            return
+        waiting = 1 if kind == "wait" else 0
+        self._local.in_wait += waiting
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._local.in_wait -= waiting
+            span.add(kind, time.perf_counter() - t0)
+
+    def record_command(self, command, seconds):
+        span = self.current()
+        if span is None:
+            return
+        # commands issued while polling inside a wait are already counted as wait
+        if not self._local.in_wait:
+            span.add(_COMMAND_KIND.get(command, "other"), seconds)
+
+    # ---------------- export ----------------
+    def drain(self) -> list:
+        with self._lock:
+            spans, self._finished = self._finished, []
+        return spans
+
+    def export(self, spans, name=None):
+        """Write spans as one OTLP/JSON line to VW_TRACE_FILE and POST to VW_TRACE_ENDPOINT."""
+        if not spans:
+            return
+        payload = {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            {"key": "service.name", "value": {"stringValue": "vw-ui-tests"}},
+                            {"key": "vw.worker", "value": {"stringValue": worker_id()}},
+                        ]
+                    },
+                    "scopeSpans": [
+                        {"scope": {"name": "tests.ui"}, "spans": [s.to_otlp() for s in spans]}
+                    ],
+                }
+            ]
+        }
+        body = json.dumps(payload)
+        path = os.getenv("VW_TRACE_FILE") or os.path.join("reports", f"traces-{worker_id()}.jsonl")
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(body + "\n")
+        except OSError:
+            pass
+        endpoint = os.getenv("VW_TRACE_ENDPOINT")
+        if endpoint:
+            try:
+                requests.post(
+                    f"{endpoint.rstrip('/')}/v1/traces",
+                    data=body,
+                    headers={"Content-Type": "application/json"},
+                    timeout=5,
+                )
+            except requests.RequestException:
+                pass
+        if allure is not None and name:
+            allure.attach(
+                json.dumps(payload, indent=2),
+                name=f"{name} trace",
+                attachment_type=allure.attachment_type.JSON,
+            )
+
+
+TRACER = Tracer()
+
+
+def instrument_driver(driver):
+    """Time every WebDriver command into the current span (idempotent)."""
+    if getattr(driver, "_vw_traced", False):
+        return
+    original = driver.execute
+
+    def execute(command, params=None):
+        t0 = time.perf_counter()
+        try:
+            return original(command, params)
+        finally:
+            TRACER.record_command(command, time.perf_counter() - t0)
+
+    driver.execute = execute
+    driver._vw_traced = True
+
+
+class TimedWait(WebDriverWait):
+    """WebDriverWait whose until/until_not time is reported as `wait` on the current span."""
+
+    def until(self, method, message=""):
+        with TRACER.timed("wait"):
+            return super().until(method, message)
+
+    def until_not(self, method, message=""):
+        with TRACER.timed("wait"):
+            return super().until_not(method, message)
+
+
+_actions = threading.local()
+
+
+def action(fn):
+    """
+    Page-object hook: run `fn` as a traced action (span + Allure step) when
+    tracing is on, and as a network step for the outermost action when a
+    netcapture recorder is attached. A plain call otherwise.
+    """
+
+    @wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        traced = tracing_enabled()
+        rec = recorder_for(self.driver)
+        if not traced and rec is None:
+            return fn(self, *args, **kwargs)
+
+        name = f"{type(self).__name__}.{fn.__name__}"
+        depth = getattr(_actions, "depth", 0)
+        _actions.depth = depth + 1
+        try:
+            with (
+                TRACER.span(name, **{"vw.page": type(self).__name__}) if traced else nullcontext(),
+                allure.step(name) if traced and allure is not None else nullcontext(),
+                # nested actions (click_element inside save_item) stay in their parent's step
+                rec.step(name) if rec is not None and depth == 0 else nullcontext(),
+            ):
+                return fn(self, *args, **kwargs)
+        finally:
+            _actions.depth = depth
+
+    wrapper._vw_action = True
+    return wrapper
+
+
+def instrument_actions(cls):
+    """Wrap every public method defined on `cls` with `action`."""
+    for name, attr in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.isfunction(attr):
+            continue
+        if getattr(attr, "_vw_action", False):
+            continue
+        setattr(cls, name, action(attr))
+    return cls
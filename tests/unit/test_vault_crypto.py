@@ -0,0 +1,157 @@
+# tests/unit/test_vault_crypto.py
+import base64
+import os
+
+import pytest
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+from tests.common.vault_crypto import (
+    KDF_ARGON2ID,
+    KDF_PBKDF2,
+    SymmetricKey,
+    VaultCryptoError,
+    decrypt_bytes,
+    decrypt_cipher,
+    decrypt_ciphers,
+    derive_master_key,
+    encrypt_bytes,
+    encrypt_string,
+    stretch_master_key,
+    unwrap_user_key,
+)
+
+# Master-key vectors from the Bitwarden SDK's own KDF tests
+KAT_PASSWORD, KAT_EMAIL = "67t9b5g67$%Dh89n", "test_key"
+
+
+def _key():
+    return SymmetricKey.from_bytes(os.urandom(64))
+
+
+############ KEY DERIVATION ############
+
+
+def test_pbkdf2_master_key_known_answer():
+    key = derive_master_key(KAT_PASSWORD, KAT_EMAIL, KDF_PBKDF2, 10000)
+    assert list(key) == [
+        31, 79, 104, 226, 150, 71, 177, 90, 194, 80, 172, 209, 17, 129, 132, 81,
+        138, 167, 69, 167, 254, 149, 2, 27, 39, 197, 64, 42, 22, 195, 86, 75,
+    ]  # fmt: skip
+
+
+def test_argon2id_master_key_known_answer():
+    key = derive_master_key(KAT_PASSWORD, KAT_EMAIL, KDF_ARGON2ID, 4, 32, 2)
+    assert list(key) == [
+        207, 240, 225, 177, 162, 19, 163, 76, 98, 106, 179, 175, 224, 9, 17, 240,
+        20, 147, 237, 47, 246, 150, 141, 184, 62, 225, 131, 242, 51, 53, 225, 242,
+    ]  # fmt: skip
+
+
+def test_email_salt_is_case_and_space_insensitive():
+    assert derive_master_key("pw", " A@B.c ", KDF_PBKDF2, 1000) == derive_master_key(
+        "pw", "a@b.c", KDF_PBKDF2, 1000
+    )
+
+
+def test_unknown_kdf_rejected():
+    with pytest.raises(VaultCryptoError):
+        derive_master_key("pw", "a@b.c", 7, 1)
+
+
+############ ENCSTRING ############
+
+
+def test_round_trip_and_fresh_iv():
+    key = _key()
+    for data in (b"", b"x" * 15, b"y" * 16, os.urandom(1000)):
+        enc = encrypt_bytes(key, data)
+        assert enc.startswith("2.")
+        assert decrypt_bytes(key, enc) == data
+    assert encrypt_bytes(key, b"same") != encrypt_bytes(key, b"same")
+
+
+def test_user_key_unwrap():
+    stretched = stretch_master_key(derive_master_key("pw", "a@b.c", KDF_PBKDF2, 1000))
+    user_key = os.urandom(64)
+    unwrapped = unwrap_user_key(stretched, encrypt_bytes(stretched, user_key))
+    assert unwrapped.enc_key + unwrapped.mac_key == user_key
+
+
+def test_wrong_key_fails_mac():
+    enc = encrypt_string(_key(), "secret")
+    with pytest.raises(VaultCryptoError, match="MAC"):
+        decrypt_bytes(_key(), enc)
+
+
+def test_tampered_ciphertext_fails_mac():
+    key = _key()
+    iv, ct, mac = encrypt_string(key, "secret")[2:].split("|")
+    raw = bytearray(base64.b64decode(ct))
+    raw[0] ^= 1
+    with pytest.raises(VaultCryptoError, match="MAC"):
+        decrypt_bytes(key, f"2.{iv}|{base64.b64encode(bytes(raw)).decode()}|{mac}")
+
+
+def test_bad_padding_rejected():
+    # authentic (MAC over iv || ct) but the plaintext block isn't PKCS#7 padded
+    key = _key()
+    iv = os.urandom(16)
+    enc = Cipher(algorithms.AES(key.enc_key), modes.CBC(iv)).encryptor()
+    ct = enc.update(b"A" * 15 + b"\x00") + enc.finalize()
+    b64 = base64.b64encode
+    encstring = f"2.{b64(iv).decode()}|{b64(ct).decode()}|{b64(key.mac(iv + ct)).decode()}"
+    with pytest.raises(VaultCryptoError, match="padding"):
+        decrypt_bytes(key, encstring)
+
+
+@pytest.mark.parametrize("bad", ["", "2.abc", "0.a|b|c", "2.!!|!!|!!", None])
+def test_malformed_encstrings_rejected(bad):
+    with pytest.raises(VaultCryptoError):
+        decrypt_bytes(_key(), bad)
+
+
+############ CIPHERS ############
+
+
+def test_decrypt_cipher_with_item_key():
+    user_key, item_raw = _key(), os.urandom(64)
+    item_key = SymmetricKey.from_bytes(item_raw)
+    cipher = {
+        "id": "c1",
+        "type": 1,
+        "key": encrypt_bytes(user_key, item_raw),  # item fields are under this, not the user key
+        "name": encrypt_string(item_key, "Bank"),
+        "notes": None,
+        "login": {
+            "username": encrypt_string(item_key, "alice"),
+            "password": encrypt_string(item_key, "hunter2"),
+            "totp": None,
+            "uris": [{"uri": encrypt_string(item_key, "https://bank.example")}],
+        },
+        "fields": [
+            {"name": encrypt_string(item_key, "pin"), "value": encrypt_string(item_key, "1")}
+        ],
+    }
+    out = decrypt_cipher(user_key, cipher)
+    assert out["name"] == "Bank" and out["notes"] is None
+    assert out["login"] == {
+        "username": "alice",
+        "password": "hunter2",
+        "totp": None,
+        "uris": ["https://bank.example"],
+    }
+    assert out["fields"] == {"pin": "1"}
+    with pytest.raises(VaultCryptoError):
+        decrypt_cipher(_key(), cipher)
+
+
+def test_decrypt_ciphers_skips_org_and_foreign_items():
+    key = _key()
+    ciphers = [
+        {"Id": "mine", "Type": 2, "Name": encrypt_string(key, "Note")},  # PascalCase builds
+        {"id": "org", "organizationId": "o1", "name": encrypt_string(_key(), "x")},
+        {"id": "foreign", "type": 2, "name": encrypt_string(_key(), "x")},
+    ]
+    decrypted, skipped = decrypt_ciphers(key, ciphers)
+    assert [c["name"] for c in decrypted] == ["Note"]
+    assert [s[0] for s in skipped] == ["org", "foreign"]